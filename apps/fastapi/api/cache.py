@@ -0,0 +1,94 @@
+"""
+Shared response cache.
+
+Uses Redis when REDIS_URL is set and redis-py is installed, so cached
+entries are shared by every worker; otherwise falls back to a per-process
+LRU with the same get/set interface.
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from api.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of entries kept by the in-process fallback
+LOCAL_CACHE_SIZE = 4096
+
+# key -> (expires_at, value)
+_local_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+_redis = None
+_redis_initialized = False
+
+
+def get_redis():
+    """Get the shared Redis client, or None if Redis is not configured."""
+    global _redis, _redis_initialized
+    if not _redis_initialized:
+        _redis_initialized = True
+        if settings.REDIS_URL:
+            try:
+                from redis.asyncio import Redis
+                _redis = Redis.from_url(settings.REDIS_URL)
+                logger.info("Using Redis cache at %s", settings.REDIS_URL)
+            except ImportError as e:
+                logger.warning("redis not available, using in-process cache: %s", e)
+    return _redis
+
+
+def _local_get(key: str) -> Optional[bytes]:
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _local_cache[key]
+        return None
+    _local_cache.move_to_end(key)
+    return entry[1]
+
+
+def _local_set(key: str, value: bytes, ttl: int) -> None:
+    _local_cache[key] = (time.monotonic() + ttl, value)
+    _local_cache.move_to_end(key)
+    if len(_local_cache) > LOCAL_CACHE_SIZE:
+        _local_cache.popitem(last=False)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Cached value for key, or None on a miss."""
+    redis = get_redis()
+    if redis is not None:
+        try:
+            return await redis.get(key)
+        except Exception as e:
+            logger.warning("Redis GET failed for %s: %s", key, e)
+    return _local_get(key)
+
+
+async def cache_set(key: str, value: bytes, ttl: int) -> None:
+    """Store value under key for ttl seconds."""
+    redis = get_redis()
+    if redis is not None:
+        try:
+            await redis.set(key, value, ex=ttl)
+            return
+        except Exception as e:
+            logger.warning("Redis SET failed for %s: %s", key, e)
+    _local_set(key, value, ttl)
+
+
+async def get_or_set(
+    key: str,
+    build: Callable[[], bytes],
+    ttl: int
+) -> bytes:
+    """Cached value for key, calling build() and storing its result on a miss."""
+    value = await cache_get(key)
+    if value is None:
+        value = build()
+        await cache_set(key, value, ttl)
+    return value
@@ -1,3 +1,4 @@
+import logging
 import os
 
 from dotenv import load_dotenv
@@ -19,6 +20,22 @@ class Settings(BaseSettings):
     CLERK_PEM_PUBLIC_KEY: str = os.getenv("CLERK_PEM_PUBLIC_KEY")
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     GITHUB_TOKEN: str = os.getenv("GITHUB_TOKEN", "")  # For GitHub Models GPT-4o
+    # Coalesce concurrent feedback requests into one GPT-4o call under burst load
+    FEEDBACK_BATCHING: bool = os.getenv("FEEDBACK_BATCHING", "false").lower() == "true"
+    # Local Whisper runtime: "faster_whisper" (CTranslate2) or "transformers"
+    WHISPER_LOCAL_BACKEND: str = os.getenv("WHISPER_LOCAL_BACKEND", "faster_whisper")
+    # INT8 Whisper weights: int8_float16 for faster-whisper on CUDA (it is always
+    # INT8 on CPU), dynamic quantization for the transformers backend on CPU
+    WHISPER_INT8: bool = os.getenv("WHISPER_INT8", "false").lower() == "true"
+    # Worker threads for blocking ASR/TTS calls (roughly one per GPU or core)
+    ASR_PARALLELISM: int = int(os.getenv("ASR_PARALLELISM", "2"))
+    TTS_PARALLELISM: int = int(os.getenv("TTS_PARALLELISM", "2"))
+    # Return cached GPU memory to the driver after each WhisperSpeech synthesis
+    TTS_LOW_VRAM: bool = os.getenv("TTS_LOW_VRAM", "false").lower() == "true"
+    # Comma-separated local engines to load at startup, e.g. "whisper_local,whisperspeech"
+    PRELOAD_ENGINES: str = os.getenv("PRELOAD_ENGINES", "")
+    # Shared cache for analytics responses; empty uses a per-process cache
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
     openapi_url: str = "/openapi.json"
@@ -27,3 +44,8 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
+
+# Configure the root logger once for the whole app; modules use getLogger(__name__)
+logging.basicConfig(
+    level=logging.DEBUG if settings.ENVIRONMENT == "development" else logging.WARNING
+)
@@ -4,28 +4,20 @@ from api.endpoints.v1.routers import health, upload, therapy, analytics
 
 api_router = APIRouter()
 
+NOT_FOUND_RESPONSES = {404: {"description": "Not found"}}
 
-api_router.include_router(
-    health.router,
-    prefix="/health",
-    tags=["health"],
-    responses={404: {"description": "Not found"}},
-)
-api_router.include_router(
-    upload.router,
-    prefix="/upload",
-    tags=["upload"],
-    responses={404: {"description": "Not found"}},
-)
-api_router.include_router(
-    therapy.router,
-    prefix="/therapy",
-    tags=["therapy"],
-    responses={404: {"description": "Not found"}},
-)
-api_router.include_router(
-    analytics.router,
-    prefix="/analytics",
-    tags=["analytics"],
-    responses={404: {"description": "Not found"}},
-)
+# (router module, prefix, tag)
+ROUTERS = [
+    (health, "/health", "health"),
+    (upload, "/upload", "upload"),
+    (therapy, "/therapy", "therapy"),
+    (analytics, "/analytics", "analytics"),
+]
+
+for module, prefix, tag in ROUTERS:
+    api_router.include_router(
+        module.router,
+        prefix=prefix,
+        tags=[tag],
+        responses=NOT_FOUND_RESPONSES,
+    )
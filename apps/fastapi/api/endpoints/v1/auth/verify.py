@@ -10,10 +10,6 @@ from jose.utils import base64url_decode
 
 from api.config import settings
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
 
 ALGORITHM = "RS256"
 security = HTTPBearer()
@@ -85,10 +81,10 @@ def decode_jwt(token: str, jwks_url: str, allowed_origins: List[str]) -> Optiona
 
         # Validate authorized parties by the azp claim
         azp = payload.get("azp")
-        logging.debug(f"azp: {azp}")
+        logging.debug("azp: %s", azp)
 
         if azp and azp not in allowed_origins:
-            logging.warning(f"Unauthorized party: {azp}")
+            logging.warning("Unauthorized party: %s", azp)
             return None
 
         logging.info("JWT successfully decoded.")
@@ -101,7 +97,7 @@ def decode_jwt(token: str, jwks_url: str, allowed_origins: List[str]) -> Optiona
         logging.error("JWT claims error.")
         return None
     except exceptions.JWTError as e:
-        logging.error(f"JWT decoding error: {e}")
+        logging.error("JWT decoding error: %s", e)
         return None
 
 
@@ -6,22 +6,155 @@ Uses GitHub Models API for GPT-4o access.
 
 import os
 import json
+import asyncio
+import hashlib
 import logging
-from typing import Optional, List
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import AsyncIterator, Optional, List, Tuple
+from dataclasses import asdict, dataclass
 
-from openai import OpenAI
+from api.cache import get_redis
+from api.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of feedback responses kept in the in-process cache
+FEEDBACK_CACHE_SIZE = 4096
+# Feedback shared across workers through Redis (when configured) for a day
+FEEDBACK_REDIS_TTL = 24 * 60 * 60
+FEEDBACK_REDIS_PREFIX = "aifb:"
+# Scores are bucketed to this width before hashing to raise the hit rate
+FEEDBACK_SCORE_BUCKET = 5
+# Micro-batching: collect up to this many requests, waiting at most this long
+FEEDBACK_BATCH_SIZE = 8
+FEEDBACK_BATCH_WINDOW = 0.05  # seconds
+
+# Invariant prompt text is kept short and constant: fewer input tokens to
+# prefill, and an identical prefix for providers that cache prompts
+FEEDBACK_SYSTEM_PROMPT = (
+    "You are a supportive speech therapist. Give warm, specific, actionable, "
+    "age-appropriate feedback that acknowledges effort and focuses on "
+    "progress, not perfection."
+)
+
+FEEDBACK_ATTEMPT_TEMPLATE = (
+    'Target: "{target}"\n'
+    'Heard: "{heard}"\n'
+    "Scores /100: overall {overall:.0f}, clarity {clarity:.0f}, "
+    "pace {pace:.0f}, fluency {fluency:.0f}\n"
+    "Differences:\n{errors}{user_info}"
+)
+
+FEEDBACK_FIELDS = (
+    "feedback (2-3 sentences), encouragement (short), "
+    "specific_tips (max 3), recommended_exercises (max 2), "
+    "difficulty_adjustment (easier|same|harder)"
+)
+
+FEEDBACK_USER_TEMPLATE = "{attempt}\nReturn JSON: " + FEEDBACK_FIELDS
+
+FEEDBACK_BATCH_TEMPLATE = (
+    "Return a JSON array of {count} feedback objects for the following "
+    "{count} attempts, in the same order. Each object has: "
+    + FEEDBACK_FIELDS + "\n\n{attempts}"
+)
+
+SESSION_SUMMARY_SYSTEM_PROMPT = (
+    "You are a supportive speech therapist providing session summaries."
+)
+
+SESSION_SUMMARY_TEMPLATE = """Summarize this speech therapy session for the user:
 
-@dataclass
+**Session Stats:**
+- Duration: {duration} minutes
+- Exercises completed: {exercises}
+- Average score: {average:.0f}/100
+- Best score: {best:.0f}/100
+
+**Exercise Types Practiced:** {types}
+
+Please provide a brief, encouraging 2-3 sentence summary of their session."""
+
+WEEKLY_INSIGHTS_SYSTEM_PROMPT = (
+    "You are an encouraging speech therapist analyzing weekly progress."
+)
+
+WEEKLY_INSIGHTS_TEMPLATE = """Analyze this user's weekly speech therapy progress:
+
+**This Week:**
+- Sessions: {sessions}
+- Total practice time: {minutes} minutes
+- Average score: {average:.0f}/100
+- Score change from last week: {change:+.1f}%
+
+**Strengths:** {strengths}
+**Areas to improve:** {weaknesses}
+
+Provide a JSON response with:
+{{
+    "summary": "2-3 sentence progress summary",
+    "celebration": "Something specific to celebrate",
+    "focus_area": "One specific thing to focus on next week",
+    "goal": "A realistic goal for next week"
+}}"""
+
+# Feedback JSON is typically under 200 tokens; decode time grows with output
+FEEDBACK_MAX_TOKENS = 250
+
+
+def _json_schema_format(name: str, properties: dict) -> dict:
+    """Build a strict json_schema response format requiring every property."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+# Strict schemas make the model emit exactly these fields and stop
+FEEDBACK_RESPONSE_FORMAT = _json_schema_format("feedback", {
+    "feedback": {"type": "string"},
+    "encouragement": {"type": "string"},
+    "specific_tips": {"type": "array", "items": {"type": "string"}},
+    "recommended_exercises": {"type": "array", "items": {"type": "string"}},
+    "difficulty_adjustment": {"type": "string", "enum": ["easier", "same", "harder"]},
+})
+
+# Strict schemas need an object at the top level, so the array is wrapped
+FEEDBACK_BATCH_RESPONSE_FORMAT = _json_schema_format("feedback_batch", {
+    "results": {
+        "type": "array",
+        "items": FEEDBACK_RESPONSE_FORMAT["json_schema"]["schema"],
+    },
+})
+
+WEEKLY_INSIGHTS_RESPONSE_FORMAT = _json_schema_format("weekly_insights", {
+    "summary": {"type": "string"},
+    "celebration": {"type": "string"},
+    "focus_area": {"type": "string"},
+    "goal": {"type": "string"},
+})
+
+
+# One client, and so one keep-alive connection pool, shared per process
+_openai_client = None
+
+
+@dataclass(slots=True, frozen=True)
 class AIFeedbackResult:
     """AI-generated feedback for speech therapy."""
     feedback: str
     encouragement: str
-    specific_tips: List[str]
-    recommended_exercises: List[str]
+    specific_tips: Tuple[str, ...]
+    recommended_exercises: Tuple[str, ...]
     difficulty_adjustment: Optional[str]  # "easier", "same", "harder"
 
 
@@ -33,27 +166,117 @@ class AIFeedbackGenerator:
     """
 
     def __init__(self):
-        self.client: Optional[OpenAI] = None
+        self.client = None
         self.model = "gpt-4o"
-        self._initialize_client()
+        self._feedback_cache: OrderedDict[str, AIFeedbackResult] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[AIFeedbackResult]] = {}
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_worker: Optional[asyncio.Task] = None
+        self._batch_tasks: set[asyncio.Task] = set()
+
+    def _get_client(self):
+        """Lazy load the OpenAI client on the first GPT-4o request."""
+        if self.client is None:
+            self._initialize_client()
+        return self.client
 
     def _initialize_client(self):
         """Initialize the OpenAI client with GitHub Models."""
-        github_token = os.getenv("GITHUB_TOKEN")
+        global _openai_client
+        if _openai_client is None:
+            import httpx
+            from openai import AsyncOpenAI
+
+            github_token = os.getenv("GITHUB_TOKEN")
 
-        if not github_token:
-            raise ValueError(
-                "GITHUB_TOKEN not found. Please set it in your .env file. "
-                "Get your token at: https://github.com/settings/tokens"
+            if not github_token:
+                raise ValueError(
+                    "GITHUB_TOKEN not found. Please set it in your .env file. "
+                    "Get your token at: https://github.com/settings/tokens"
+                )
+
+            # HTTP/2 multiplexes concurrent requests over one TLS connection
+            limits = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+            try:
+                http_client = httpx.AsyncClient(http2=True, limits=limits)
+            except ImportError:
+                logger.warning("h2 not installed, using HTTP/1.1 for GitHub Models")
+                http_client = httpx.AsyncClient(limits=limits)
+
+            # Use GitHub Models (free GPT-4o access)
+            _openai_client = AsyncOpenAI(
+                base_url="https://models.inference.ai.azure.com",
+                api_key=github_token,
+                http_client=http_client,
             )
+            logger.info("AI Feedback: Using GitHub Models (GPT-4o)")
 
-        # Use GitHub Models (free GPT-4o access)
-        self.client = OpenAI(
-            base_url="https://models.inference.ai.azure.com",
-            api_key=github_token,
-        )
+        self.client = _openai_client
         self.model = "gpt-4o"
-        logger.info("AI Feedback: Using GitHub Models (GPT-4o)")
+
+    def _feedback_attempt(
+        self,
+        target_text: str,
+        transcription: str,
+        overall_score: float,
+        clarity_score: float,
+        pace_score: float,
+        fluency_score: float,
+        error_summary: str,
+        user_context: Optional[dict] = None
+    ) -> str:
+        """Describe a single attempt for the feedback prompt."""
+        # Build context about user if available
+        user_info = ""
+        if user_context:
+            condition = user_context.get("speech_condition", "")
+            severity = user_context.get("severity_level", "")
+            if condition:
+                user_info = f"\nUser has {condition}"
+                if severity:
+                    user_info += f" (severity: {severity}/5)"
+                user_info += ". Adjust feedback accordingly."
+
+        return FEEDBACK_ATTEMPT_TEMPLATE.format(
+            target=target_text,
+            heard=transcription,
+            overall=overall_score,
+            clarity=clarity_score,
+            pace=pace_score,
+            fluency=fluency_score,
+            errors=error_summary or "none",
+            user_info=user_info
+        )
+
+    def _feedback_messages(self, attempt: str) -> List[dict]:
+        """Build the chat messages for a single feedback request."""
+        return [
+            {"role": "system", "content": FEEDBACK_SYSTEM_PROMPT},
+            {"role": "user", "content": FEEDBACK_USER_TEMPLATE.format(attempt=attempt)}
+        ]
+
+    def _feedback_cache_key(
+        self,
+        target_text: str,
+        transcription: str,
+        scores: tuple[float, ...],
+        error_summary: str,
+        user_context: Optional[dict] = None
+    ) -> str:
+        """Hash the inputs that shape a feedback response into a cache key."""
+        payload = {
+            "t": target_text,
+            "tx": transcription,
+            "s": [round(score / FEEDBACK_SCORE_BUCKET) for score in scores],
+            "e": error_summary,
+            "u": [
+                user_context.get("speech_condition", ""),
+                user_context.get("severity_level", "")
+            ] if user_context else None,
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode()
+        ).hexdigest()
 
     async def generate_feedback(
         self,
@@ -63,7 +286,7 @@ class AIFeedbackGenerator:
         clarity_score: float,
         pace_score: float,
         fluency_score: float,
-        errors: List[dict],
+        error_summary: str,
         user_context: Optional[dict] = None
     ) -> AIFeedbackResult:
         """
@@ -76,111 +299,259 @@ class AIFeedbackGenerator:
             clarity_score: 0-100 clarity score
             pace_score: 0-100 pace score
             fluency_score: 0-100 fluency score
-            errors: List of pronunciation errors detected
+            error_summary: Detected errors, one "- 'expected' → 'actual' (type)"
+                line each (at most 5), or "" when there are none
             user_context: Optional user profile info (speech condition, etc.)
 
         Returns:
             AIFeedbackResult with personalized feedback
         """
-        # Build context about user if available
-        user_info = ""
-        if user_context:
-            condition = user_context.get("speech_condition", "")
-            severity = user_context.get("severity_level", "")
-            if condition:
-                user_info = f"\nUser has {condition}"
-                if severity:
-                    user_info += f" (severity: {severity}/5)"
-                user_info += ". Adjust feedback accordingly."
-
-        # Format errors for the prompt
-        error_summary = ""
-        if errors:
-            error_items = []
-            for e in errors[:5]:  # Limit to 5 errors
-                error_items.append(
-                    f"- '{e.get('expected', '')}' → '{e.get('actual', '')}' ({e.get('error_type', '')})"
+        cache_key = self._feedback_cache_key(
+            target_text,
+            transcription,
+            (overall_score, clarity_score, pace_score, fluency_score),
+            error_summary,
+            user_context
+        )
+        cached = self._feedback_cache.get(cache_key)
+        if cached is not None:
+            self._feedback_cache.move_to_end(cache_key)
+            return cached
+
+        # Identical requests already in flight share a single API call. The
+        # call runs in its own task so a cancelled caller never cancels it
+        # for the others
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.create_task(self._fetch_feedback(
+                cache_key,
+                self._feedback_attempt(
+                    target_text, transcription, overall_score, clarity_score,
+                    pace_score, fluency_score, error_summary, user_context
                 )
-            error_summary = "\n".join(error_items)
-
-        system_prompt = """You are a supportive, encouraging speech therapist helping users improve their speech clarity.
-
-Your feedback should be:
-- Warm and encouraging, never discouraging
-- Specific and actionable
-- Age-appropriate and easy to understand
-- Focused on progress, not perfection
-
-Always acknowledge effort and provide constructive guidance."""
-
-        user_prompt = f"""Please provide feedback for this speech exercise attempt:
-
-**Target phrase:** "{target_text}"
-**User said:** "{transcription}"
+            ))
+            self._inflight[cache_key] = inflight
+            inflight.add_done_callback(
+                lambda task: self._finish_inflight(cache_key, task)
+            )
+        return await asyncio.shield(inflight)
+
+    async def _fetch_feedback(self, cache_key: str, attempt: str) -> AIFeedbackResult:
+        """Feedback from Redis or the API, stored in both caches."""
+        feedback = await self._load_shared_feedback(cache_key)
+        if feedback is None:
+            feedback = await self._request_feedback(attempt)
+            await self._store_shared_feedback(cache_key, feedback)
+
+        self._feedback_cache[cache_key] = feedback
+        if len(self._feedback_cache) > FEEDBACK_CACHE_SIZE:
+            self._feedback_cache.popitem(last=False)
+        return feedback
+
+    def _finish_inflight(self, cache_key: str, task: asyncio.Task):
+        del self._inflight[cache_key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller was cancelled
+
+    async def _load_shared_feedback(self, cache_key: str) -> Optional[AIFeedbackResult]:
+        """Feedback another worker already generated, if Redis has it."""
+        redis = get_redis()
+        if redis is None:
+            return None
+        try:
+            data = await redis.get(FEEDBACK_REDIS_PREFIX + cache_key)
+        except Exception as e:
+            logger.warning("Redis feedback lookup failed: %s", e)
+            return None
+        if data is None:
+            return None
+
+        fields = json.loads(data)
+        return AIFeedbackResult(
+            feedback=fields["feedback"],
+            encouragement=fields["encouragement"],
+            specific_tips=tuple(fields["specific_tips"]),
+            recommended_exercises=tuple(fields["recommended_exercises"]),
+            difficulty_adjustment=fields["difficulty_adjustment"]
+        )
 
-**Scores:**
-- Overall: {overall_score:.0f}/100
-- Clarity: {clarity_score:.0f}/100
-- Pace: {pace_score:.0f}/100
-- Fluency: {fluency_score:.0f}/100
+    async def _store_shared_feedback(self, cache_key: str, feedback: AIFeedbackResult):
+        """Share generated feedback with other workers through Redis."""
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(
+                FEEDBACK_REDIS_PREFIX + cache_key,
+                json.dumps(asdict(feedback)),
+                ex=FEEDBACK_REDIS_TTL
+            )
+        except Exception as e:
+            logger.warning("Redis feedback store failed: %s", e)
+
+    async def _request_feedback(self, attempt: str) -> AIFeedbackResult:
+        """Request feedback for one attempt, batching it if enabled."""
+        if not settings.FEEDBACK_BATCHING:
+            return await self._request_single_feedback(attempt)
+
+        if self._batch_worker is None or self._batch_worker.done():
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = asyncio.create_task(self._collect_feedback_batches())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((attempt, future))
+        return await future
+
+    async def _collect_feedback_batches(self):
+        """Group queued attempts arriving within the batch window."""
+        queue = self._batch_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + FEEDBACK_BATCH_WINDOW
+            while len(batch) < FEEDBACK_BATCH_SIZE:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(queue.get(), deadline - loop.time())
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # Skip callers that were cancelled while waiting
+            batch = [(attempt, future) for attempt, future in batch if not future.done()]
+            if batch:
+                task = asyncio.create_task(self._dispatch_feedback_batch(batch))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+
+    async def _dispatch_feedback_batch(
+        self,
+        batch: List[Tuple[str, asyncio.Future]]
+    ):
+        """Send one batch to GPT-4o and fan the results back out."""
+        attempts = [attempt for attempt, _ in batch]
+        try:
+            if len(attempts) == 1:
+                results = [await self._request_single_feedback(attempts[0])]
+            else:
+                results = await self._request_feedback_batch(attempts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), feedback in zip(batch, results):
+            if not future.done():
+                future.set_result(feedback)
+
+    async def _request_feedback_batch(self, attempts: List[str]) -> List[AIFeedbackResult]:
+        """Call GPT-4o once for several attempts."""
+        numbered = "\n\n".join(
+            f"{i}.\n{attempt}" for i, attempt in enumerate(attempts, 1)
+        )
+        response = await self._get_client().chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": FEEDBACK_SYSTEM_PROMPT},
+                {"role": "user", "content": FEEDBACK_BATCH_TEMPLATE.format(
+                    count=len(attempts), attempts=numbered
+                )}
+            ],
+            temperature=0.7,
+            max_tokens=FEEDBACK_MAX_TOKENS * len(attempts),
+            response_format=FEEDBACK_BATCH_RESPONSE_FORMAT
+        )
 
-**Pronunciation differences:**
-{error_summary if error_summary else "No major differences detected"}
-{user_info}
+        results = json.loads(response.choices[0].message.content)["results"]
+        if len(results) != len(attempts):
+            logger.warning(
+                "Batched feedback returned %d results for %d attempts, "
+                "retrying individually", len(results), len(attempts)
+            )
+            return list(await asyncio.gather(
+                *(self._request_single_feedback(attempt) for attempt in attempts)
+            ))
 
-Please respond in this JSON format:
-{{
-    "feedback": "2-3 sentences of overall feedback",
-    "encouragement": "A short encouraging message",
-    "specific_tips": ["tip 1", "tip 2", "tip 3"],
-    "recommended_exercises": ["exercise 1", "exercise 2"],
-    "difficulty_adjustment": "easier" or "same" or "harder"
-}}"""
+        return [self._parse_feedback(result) for result in results]
 
-        response = self.client.chat.completions.create(
+    async def _request_single_feedback(self, attempt: str) -> AIFeedbackResult:
+        """Call GPT-4o for a single feedback response."""
+        response = await self._get_client().chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=self._feedback_messages(attempt),
             temperature=0.7,
-            max_tokens=500,
-            response_format={"type": "json_object"}
+            max_tokens=FEEDBACK_MAX_TOKENS,
+            response_format=FEEDBACK_RESPONSE_FORMAT
         )
 
         # Parse the response
-        result = json.loads(response.choices[0].message.content)
+        return self._parse_feedback(json.loads(response.choices[0].message.content))
 
+    def _parse_feedback(self, result: dict) -> AIFeedbackResult:
+        """Build an AIFeedbackResult from a parsed JSON feedback object."""
         return AIFeedbackResult(
             feedback=result.get("feedback", "Good effort! Keep practicing."),
             encouragement=result.get("encouragement", "You're making progress!"),
-            specific_tips=result.get("specific_tips", []),
-            recommended_exercises=result.get("recommended_exercises", []),
+            specific_tips=tuple(result.get("specific_tips", [])),
+            recommended_exercises=tuple(result.get("recommended_exercises", [])),
             difficulty_adjustment=result.get("difficulty_adjustment", "same")
         )
 
+    async def stream_feedback(
+        self,
+        target_text: str,
+        transcription: str,
+        overall_score: float,
+        clarity_score: float,
+        pace_score: float,
+        fluency_score: float,
+        error_summary: str,
+        user_context: Optional[dict] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream feedback for a speech exercise attempt as it is generated.
+
+        Takes the same arguments as generate_feedback, but yields the raw
+        JSON text in chunks as GPT-4o produces it instead of waiting for
+        the complete response.
+        """
+        response = await self._get_client().chat.completions.create(
+            model=self.model,
+            messages=self._feedback_messages(
+                self._feedback_attempt(
+                    target_text, transcription, overall_score, clarity_score,
+                    pace_score, fluency_score, error_summary, user_context
+                )
+            ),
+            temperature=0.7,
+            max_tokens=FEEDBACK_MAX_TOKENS,
+            response_format=FEEDBACK_RESPONSE_FORMAT,
+            stream=True
+        )
+
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     async def generate_session_summary(
         self,
         session_stats: dict,
         attempts: List[dict]
     ) -> str:
         """Generate an AI summary of a therapy session."""
-        prompt = f"""Summarize this speech therapy session for the user:
-
-**Session Stats:**
-- Duration: {session_stats.get('duration_minutes', 0)} minutes
-- Exercises completed: {session_stats.get('exercise_count', 0)}
-- Average score: {session_stats.get('average_score', 0):.0f}/100
-- Best score: {session_stats.get('best_score', 0):.0f}/100
-
-**Exercise Types Practiced:** {', '.join(session_stats.get('exercise_types', []))}
-
-Please provide a brief, encouraging 2-3 sentence summary of their session."""
+        prompt = SESSION_SUMMARY_TEMPLATE.format(
+            duration=session_stats.get("duration_minutes", 0),
+            exercises=session_stats.get("exercise_count", 0),
+            average=session_stats.get("average_score", 0),
+            best=session_stats.get("best_score", 0),
+            types=", ".join(session_stats.get("exercise_types", []))
+        )
 
-        response = self.client.chat.completions.create(
+        response = await self._get_client().chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are a supportive speech therapist providing session summaries."},
+                {"role": "system", "content": SESSION_SUMMARY_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
@@ -194,34 +565,24 @@ Please provide a brief, encouraging 2-3 sentence summary of their session."""
         weekly_data: dict
     ) -> dict:
         """Generate AI-powered weekly progress insights."""
-        prompt = f"""Analyze this user's weekly speech therapy progress:
-
-**This Week:**
-- Sessions: {weekly_data.get('sessions_this_week', 0)}
-- Total practice time: {weekly_data.get('practice_minutes', 0)} minutes
-- Average score: {weekly_data.get('avg_score', 0):.0f}/100
-- Score change from last week: {weekly_data.get('score_change', 0):+.1f}%
-
-**Strengths:** {', '.join(weekly_data.get('strengths', ['Consistent practice']))}
-**Areas to improve:** {', '.join(weekly_data.get('weaknesses', ['Continue practicing']))}
-
-Provide a JSON response with:
-{{
-    "summary": "2-3 sentence progress summary",
-    "celebration": "Something specific to celebrate",
-    "focus_area": "One specific thing to focus on next week",
-    "goal": "A realistic goal for next week"
-}}"""
+        prompt = WEEKLY_INSIGHTS_TEMPLATE.format(
+            sessions=weekly_data.get("sessions_this_week", 0),
+            minutes=weekly_data.get("practice_minutes", 0),
+            average=weekly_data.get("avg_score", 0),
+            change=weekly_data.get("score_change", 0),
+            strengths=", ".join(weekly_data.get("strengths", ["Consistent practice"])),
+            weaknesses=", ".join(weekly_data.get("weaknesses", ["Continue practicing"]))
+        )
 
-        response = self.client.chat.completions.create(
+        response = await self._get_client().chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are an encouraging speech therapist analyzing weekly progress."},
+                {"role": "system", "content": WEEKLY_INSIGHTS_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
             max_tokens=300,
-            response_format={"type": "json_object"}
+            response_format=WEEKLY_INSIGHTS_RESPONSE_FORMAT
         )
 
         return json.loads(response.choices[0].message.content)
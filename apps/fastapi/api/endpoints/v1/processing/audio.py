@@ -7,11 +7,6 @@ from api.config import settings
 
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
-
 
 def transcribe_with_whisper(
     filename: str, file_like: io.BytesIO, content_type: str
@@ -27,5 +22,5 @@ def transcribe_with_whisper(
         model="whisper-1", file=file_data
     )
 
-    logging.debug(f"Transcription: {transcription.text}")
+    logging.debug("Transcription: %s", transcription.text)
     return transcription
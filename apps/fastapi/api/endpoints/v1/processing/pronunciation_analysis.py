@@ -11,16 +11,20 @@ Provides:
 
 import io
 import logging
-from typing import Optional, List
-from dataclasses import dataclass, field
+from collections import Counter, defaultdict
+from typing import Optional, List, Tuple
+from dataclasses import dataclass
 from enum import Enum
 
-from api.config import settings
+import numpy as np
+from rapidfuzz.distance import Levenshtein
+from rapidfuzz.process import cdist
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
+
+# Alignment penalty for an omitted or extra word (word pairs score -1 to 1)
+GAP_PENALTY = -0.5
+# Fluency points lost per skipped or extra word
+FLUENCY_GAP_PENALTY = 5.0
 
 
 class ErrorType(str, Enum):
@@ -31,7 +35,16 @@ class ErrorType(str, Enum):
     DISTORTION = "distortion"      # Unclear sound
 
 
-@dataclass
+# Clarity score penalty per error, by type
+ERROR_PENALTIES = {
+    ErrorType.DISTORTION: 15,
+    ErrorType.SUBSTITUTION: 10,
+    ErrorType.OMISSION: 20,
+    ErrorType.ADDITION: 5,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PhonemeError:
     """Individual phoneme-level error."""
     word: str
@@ -42,27 +55,27 @@ class PhonemeError:
     suggestion: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WordScore:
     """Per-word pronunciation score."""
     word: str
     score: float  # 0-100
     start_time: Optional[float] = None
     end_time: Optional[float] = None
-    errors: List[PhonemeError] = field(default_factory=list)
+    errors: Tuple[PhonemeError, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AIFeedback:
     """AI-generated personalized feedback."""
     feedback: str
     encouragement: str
-    specific_tips: List[str]
-    recommended_exercises: List[str]
+    specific_tips: Tuple[str, ...]
+    recommended_exercises: Tuple[str, ...]
     difficulty_adjustment: Optional[str] = None  # "easier", "same", "harder"
 
 
-@dataclass
+@dataclass(slots=True)
 class PronunciationFeedback:
     """Complete pronunciation analysis result."""
     overall_score: float           # 0-100
@@ -78,6 +91,18 @@ class PronunciationFeedback:
     ai_feedback: Optional[AIFeedback] = None  # GPT-4o powered feedback
 
 
+# Attempts at or above this score with no errors skip GPT-4o feedback
+PERFECT_SCORE_THRESHOLD = 92.0
+
+PERFECT_ATTEMPT_FEEDBACK = AIFeedback(
+    feedback="Excellent! You said every word clearly and correctly.",
+    encouragement="Fantastic work, keep it up!",
+    specific_tips=("Keep the same steady pace and clear sounds",),
+    recommended_exercises=("Try a longer phrase or a tongue twister",),
+    difficulty_adjustment="harder"
+)
+
+
 class PronunciationAnalyzer:
     """
     Analyze pronunciation against target text.
@@ -126,19 +151,19 @@ class PronunciationAnalyzer:
         Returns:
             PronunciationFeedback with scores, suggestions, and AI feedback
         """
-        logging.info(f"Analyzing pronunciation for target: {target_text}")
+        logging.info("Analyzing pronunciation for target: %s", target_text)
 
         # 1. Transcribe the audio
         asr = self._get_asr()
-        result = asr.transcribe(audio_bytes)
+        result = await asr.atranscribe(audio_bytes)
         transcription = result.text.strip().lower()
         target_clean = target_text.strip().lower()
 
-        logging.debug(f"Transcription: {transcription}")
-        logging.debug(f"Target: {target_clean}")
+        logging.debug("Transcription: %s", transcription)
+        logging.debug("Target: %s", target_clean)
 
         # 2. Compare transcription to target
-        word_scores, phoneme_errors = self._compare_texts(
+        word_scores, phoneme_errors, alignment_gaps = self._compare_texts(
             transcription, target_clean
         )
 
@@ -146,26 +171,28 @@ class PronunciationAnalyzer:
         overall_score = self._calculate_overall_score(word_scores)
         clarity_score = self._calculate_clarity_score(word_scores, phoneme_errors)
         pace_score = self._calculate_pace_score(result.word_timestamps)
-        fluency_score = self._calculate_fluency_score(transcription, target_clean)
+        fluency_score = self._calculate_fluency_score(overall_score, alignment_gaps)
 
         # 4. Generate rule-based suggestions
         suggestions = self._generate_suggestions(phoneme_errors, word_scores)
 
         # 5. Generate AI-powered feedback (GPT-4o via GitHub Models)
         ai_feedback = None
-        if include_ai_feedback:
+        if (
+            include_ai_feedback
+            and overall_score >= PERFECT_SCORE_THRESHOLD
+            and not phoneme_errors
+        ):
+            # Nothing for GPT-4o to correct; skip the network round trip
+            ai_feedback = PERFECT_ATTEMPT_FEEDBACK
+        elif include_ai_feedback:
             try:
                 ai_generator = self._get_ai_feedback_generator()
-                # Convert phoneme errors to dict format for AI
-                errors_dict = [
-                    {
-                        "word": e.word,
-                        "expected": e.expected,
-                        "actual": e.actual,
-                        "error_type": e.error_type.value
-                    }
-                    for e in phoneme_errors
-                ]
+                # Format the first few errors straight into prompt lines
+                error_summary = "\n".join(
+                    f"- '{e.expected}' → '{e.actual}' ({e.error_type.value})"
+                    for e in phoneme_errors[:5]
+                )
 
                 ai_result = await ai_generator.generate_feedback(
                     target_text=target_text,
@@ -174,7 +201,7 @@ class PronunciationAnalyzer:
                     clarity_score=clarity_score,
                     pace_score=pace_score,
                     fluency_score=fluency_score,
-                    errors=errors_dict,
+                    error_summary=error_summary,
                     user_context=user_context
                 )
 
@@ -187,7 +214,7 @@ class PronunciationAnalyzer:
                 )
                 logging.info("AI feedback generated successfully")
             except Exception as e:
-                logging.warning(f"AI feedback generation failed: {e}")
+                logging.warning("AI feedback generation failed: %s", e)
                 ai_feedback = None
 
         return PronunciationFeedback(
@@ -207,26 +234,41 @@ class PronunciationAnalyzer:
         self,
         transcription: str,
         target: str
-    ) -> tuple[List[WordScore], List[PhonemeError]]:
-        """Compare transcribed text to target text."""
+    ) -> tuple[List[WordScore], List[PhonemeError], int]:
+        """
+        Compare transcribed text to target text.
+
+        Returns:
+            Word scores, pronunciation errors, and the number of alignment
+            gaps (words skipped or added)
+        """
         trans_words = transcription.split()
         target_words = target.split()
 
         word_scores = []
         phoneme_errors = []
+        alignment_gaps = 0
+
+        # Score every target/transcribed word pair in a single batched call
+        similarity = cdist(
+            target_words,
+            trans_words,
+            scorer=Levenshtein.normalized_similarity,
+            dtype=np.float64
+        )
 
-        # Simple word-level comparison (can be enhanced with phoneme alignment)
-        max_len = max(len(trans_words), len(target_words))
-
-        for i in range(max_len):
-            target_word = target_words[i] if i < len(target_words) else ""
-            trans_word = trans_words[i] if i < len(trans_words) else ""
+        # Align words globally so a skipped or extra word doesn't shift
+        # every following word out of position
+        for t_idx, w_idx in self._align_words(similarity):
+            target_word = target_words[t_idx] if t_idx is not None else ""
+            trans_word = trans_words[w_idx] if w_idx is not None else ""
 
             if not target_word:
                 # Extra word in transcription
+                alignment_gaps += 1
                 phoneme_errors.append(PhonemeError(
                     word=trans_word,
-                    position=i,
+                    position=w_idx,
                     expected="",
                     actual=trans_word,
                     error_type=ErrorType.ADDITION,
@@ -236,47 +278,96 @@ class PronunciationAnalyzer:
 
             if not trans_word:
                 # Missing word
+                alignment_gaps += 1
                 word_scores.append(WordScore(
                     word=target_word,
                     score=0.0,
-                    errors=[PhonemeError(
+                    errors=(PhonemeError(
                         word=target_word,
-                        position=i,
+                        position=t_idx,
                         expected=target_word,
                         actual=None,
                         error_type=ErrorType.OMISSION,
                         suggestion=f"Try to include the word '{target_word}'"
-                    )]
+                    ),)
                 ))
                 phoneme_errors.append(word_scores[-1].errors[0])
                 continue
 
             # Compare words
-            score, errors = self._compare_words(target_word, trans_word, i)
+            score, errors = self._compare_words(
+                target_word, trans_word, t_idx, float(similarity[t_idx, w_idx])
+            )
             word_scores.append(WordScore(
                 word=target_word,
                 score=score,
-                errors=errors
+                errors=tuple(errors)
             ))
             phoneme_errors.extend(errors)
 
-        return word_scores, phoneme_errors
+        return word_scores, phoneme_errors, alignment_gaps
+
+    def _align_words(
+        self,
+        similarity: np.ndarray
+    ) -> List[tuple[Optional[int], Optional[int]]]:
+        """
+        Needleman-Wunsch alignment of target words against transcribed words.
+
+        Args:
+            similarity: Target x transcription word similarity matrix (0-1)
+
+        Returns:
+            (target_index, trans_index) pairs in order; None marks a gap
+        """
+        n, m = similarity.shape
+        # Rescale to -1..1 so pairing unrelated words costs more than a gap
+        pair_rows = (2 * similarity - 1).tolist()
+
+        # Cumulative alignment scores
+        score = [[j * GAP_PENALTY for j in range(m + 1)]]
+        for i in range(1, n + 1):
+            prev, pair = score[i - 1], pair_rows[i - 1]
+            row = [i * GAP_PENALTY]
+            for j in range(1, m + 1):
+                row.append(max(
+                    prev[j - 1] + pair[j - 1],  # pair words
+                    prev[j] + GAP_PENALTY,      # target word omitted
+                    row[j - 1] + GAP_PENALTY    # extra transcribed word
+                ))
+            score.append(row)
+
+        # Trace back from the bottom-right corner
+        alignment = []
+        i, j = n, m
+        while i > 0 or j > 0:
+            if i > 0 and j > 0 and score[i][j] == score[i - 1][j - 1] + pair_rows[i - 1][j - 1]:
+                i, j = i - 1, j - 1
+                alignment.append((i, j))
+            elif i > 0 and score[i][j] == score[i - 1][j] + GAP_PENALTY:
+                i -= 1
+                alignment.append((i, None))
+            else:
+                j -= 1
+                alignment.append((None, j))
+
+        alignment.reverse()
+        return alignment
 
     def _compare_words(
         self,
         target_word: str,
         trans_word: str,
-        position: int
+        position: int,
+        similarity: float
     ) -> tuple[float, List[PhonemeError]]:
-        """Compare two words and return score and errors."""
+        """Compare two words given their precomputed similarity (0-1)."""
         errors = []
 
         # Exact match
         if target_word == trans_word:
             return 100.0, []
 
-        # Calculate similarity (simple Levenshtein-based)
-        similarity = self._word_similarity(target_word, trans_word)
         score = similarity * 100
 
         # Detect error type
@@ -302,38 +393,6 @@ class PronunciationAnalyzer:
 
         return score, errors
 
-    def _word_similarity(self, word1: str, word2: str) -> float:
-        """Calculate similarity between two words (0-1)."""
-        if word1 == word2:
-            return 1.0
-
-        # Levenshtein distance normalized
-        len1, len2 = len(word1), len(word2)
-        if len1 == 0 or len2 == 0:
-            return 0.0
-
-        # Create distance matrix
-        dp = [[0] * (len2 + 1) for _ in range(len1 + 1)]
-
-        for i in range(len1 + 1):
-            dp[i][0] = i
-        for j in range(len2 + 1):
-            dp[0][j] = j
-
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                cost = 0 if word1[i-1] == word2[j-1] else 1
-                dp[i][j] = min(
-                    dp[i-1][j] + 1,      # deletion
-                    dp[i][j-1] + 1,      # insertion
-                    dp[i-1][j-1] + cost  # substitution
-                )
-
-        distance = dp[len1][len2]
-        max_len = max(len1, len2)
-
-        return 1.0 - (distance / max_len)
-
     def _calculate_overall_score(self, word_scores: List[WordScore]) -> float:
         """Calculate overall pronunciation score."""
         if not word_scores:
@@ -350,16 +409,11 @@ class PronunciationAnalyzer:
             return 0.0
 
         # Penalize based on error types
-        error_penalties = {
-            ErrorType.DISTORTION: 15,
-            ErrorType.SUBSTITUTION: 10,
-            ErrorType.OMISSION: 20,
-            ErrorType.ADDITION: 5,
-        }
-
-        base_score = 100.0
-        for error in errors:
-            base_score -= error_penalties.get(error.error_type, 10)
+        counts = Counter(e.error_type for e in errors)
+        base_score = 100.0 - sum(
+            ERROR_PENALTIES[error_type] * count
+            for error_type, count in counts.items()
+        )
 
         return max(0.0, base_score)
 
@@ -388,9 +442,13 @@ class PronunciationAnalyzer:
         else:
             return 50.0
 
-    def _calculate_fluency_score(self, transcription: str, target: str) -> float:
-        """Calculate fluency based on text similarity."""
-        return self._word_similarity(transcription, target) * 100
+    def _calculate_fluency_score(
+        self,
+        overall_score: float,
+        alignment_gaps: int
+    ) -> float:
+        """Calculate fluency from the mean word score, penalizing skipped or extra words."""
+        return max(0.0, overall_score - FLUENCY_GAP_PENALTY * alignment_gaps)
 
     def _generate_suggestions(
         self,
@@ -401,9 +459,9 @@ class PronunciationAnalyzer:
         suggestions = []
 
         # Group errors by type
-        error_types = {}
+        error_types = defaultdict(list)
         for error in errors:
-            error_types.setdefault(error.error_type, []).append(error)
+            error_types[error.error_type].append(error)
 
         # Generate suggestions based on error patterns
         if ErrorType.OMISSION in error_types:
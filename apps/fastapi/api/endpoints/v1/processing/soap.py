@@ -8,11 +8,6 @@ from api.config import settings
 
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
-
 
 def generate_soap(transcript: str) -> str:
     """Helper function to generate soap note from transcript using OpenAI Chat Completions API."""
@@ -115,5 +110,5 @@ def generate_soap(transcript: str) -> str:
         ],
     )
 
-    logging.debug(f"SOAP: {completion.choices[0].message.content}")
+    logging.debug("SOAP: %s", completion.choices[0].message.content)
     return completion.choices[0].message.content
@@ -3,32 +3,102 @@ Therapy ASR Module - Multi-engine speech recognition for therapy applications.
 
 Supports:
 - Local Whisper (general speech, privacy-focused)
+- Whisper on TensorRT (NVIDIA GPUs, via NVIDIA-AI-IOT/whisper_trt)
 - SpeechBrain (fine-tuned for atypical speech)
 - OpenAI Whisper API (fallback)
 """
 
 import io
+import os
+import wave
+import asyncio
 import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from dataclasses import dataclass
 
 from api.config import settings
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
 
 
 class ASREngine(str, Enum):
     """Available ASR engines."""
     WHISPER_LOCAL = "whisper_local"
+    WHISPER_TRT = "whisper_trt"
     SPEECHBRAIN = "speechbrain"
     WHISPER_API = "whisper_api"
     AUTO = "auto"  # Automatically select based on user profile
 
 
+# Let the CUDA caching allocator grow segments in place rather than
+# fragmenting; must be set before torch is first imported
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF",
+    "expandable_segments:True,max_split_size_mb:64"
+)
+
+# Blocking model and API calls run here so they never stall the event loop
+_inference_pool = ThreadPoolExecutor(
+    max_workers=settings.ASR_PARALLELISM,
+    thread_name_prefix="asr"
+)
+
+# Dynamic batching for the transformers Whisper backend: collect up to this
+# many concurrent requests, waiting at most this long
+WHISPER_MAX_BATCH_SIZE = 8
+WHISPER_BATCH_WINDOW = 0.02  # seconds
+# Under backlog, drain up to this many batches' worth of queued clips and
+# regroup them by length so each generate() call decodes similar-length audio
+WHISPER_SORT_BATCHES = 4
+
+# Greedy decoding reusing the KV cache; 224 new tokens covers a 30 s window
+WHISPER_GENERATE_KWARGS = {
+    "use_cache": True,
+    "num_beams": 1,
+    "do_sample": False,
+    "max_new_tokens": 224,
+    "return_timestamps": False,
+}
+
+
+def _silent_wav(seconds: float = 1.0, sample_rate: int = 16000) -> bytes:
+    """Encode a short 16-bit mono silent WAV, used to warm up engines."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\0\0" * int(seconds * sample_rate))
+    return buffer.getvalue()
+
+
+def _load_audio(audio_data: bytes, sample_rate: int = 16000):
+    """Decode audio bytes to a mono float32 numpy array at sample_rate."""
+    import soundfile as sf
+
+    try:
+        audio_array, sr = sf.read(io.BytesIO(audio_data), dtype="float32", always_2d=False)
+    except sf.LibsndfileError:
+        # Codecs libsndfile can't read (webm, m4a, ...) go through audioread
+        import librosa
+        audio_array, _ = librosa.load(io.BytesIO(audio_data), sr=sample_rate)
+        return audio_array
+
+    if audio_array.ndim == 2:
+        audio_array = audio_array.mean(axis=1)
+    if sr != sample_rate:
+        import torch
+        import torchaudio
+        audio_array = torchaudio.functional.resample(
+            torch.from_numpy(audio_array), sr, sample_rate
+        ).numpy()
+    return audio_array
+
+
 @dataclass
 class TranscriptionResult:
     """Structured transcription result."""
@@ -50,8 +120,19 @@ class TherapyASR:
     def __init__(self, default_engine: ASREngine = ASREngine.AUTO):
         self.default_engine = default_engine
         self._whisper_local_model = None
+        self._whisper_trt_model = None
         self._speechbrain_model = None
         self._openai_client = None
+        # Serializes loading and generate() on the transformers Whisper model
+        self._whisper_lock = threading.Lock()
+        # Whisper's mel filter bank and STFT window, cached on the model's GPU
+        self._mel_filters = None
+        self._mel_window = None
+        # Device buffers for audio and features, reused for the same shape
+        self._buffer_pool = {}
+        self._whisper_batch_queue: Optional[asyncio.Queue] = None
+        self._whisper_batch_worker: Optional[asyncio.Task] = None
+        self._whisper_batch_tasks: set[asyncio.Task] = set()
 
     def _get_openai_client(self):
         """Lazy load OpenAI client."""
@@ -63,27 +144,124 @@ class TherapyASR:
     def _get_whisper_local(self):
         """Lazy load local Whisper model."""
         if self._whisper_local_model is None:
-            try:
-                import torch
-                from transformers import WhisperProcessor, WhisperForConditionalGeneration
+            with self._whisper_lock:
+                if self._whisper_local_model is None:
+                    if settings.WHISPER_LOCAL_BACKEND == "transformers":
+                        self._load_whisper_transformers()
+                    else:
+                        self._load_faster_whisper()
+        return self._whisper_local_model
 
-                model_name = "openai/whisper-base"  # Start with base, upgrade as needed
-                logging.info(f"Loading local Whisper model: {model_name}")
+    def _load_faster_whisper(self):
+        """Load Whisper on CTranslate2: INT8 on CPU, FP16 (or INT8 weights) on CUDA."""
+        try:
+            import ctranslate2
+            from faster_whisper import WhisperModel
+
+            cuda = ctranslate2.get_cuda_device_count() > 0
+            if not cuda:
+                compute_type = "int8"
+            elif settings.WHISPER_INT8:
+                # INT8 weights with FP16 activations: half the weight bytes of FP16
+                compute_type = "int8_float16"
+            else:
+                compute_type = "float16"
+            logger.info("Loading faster-whisper model: base (%s)", compute_type)
+
+            self._whisper_local_model = WhisperModel(
+                "base",
+                device="cuda" if cuda else "cpu",
+                compute_type=compute_type
+            )
+
+            logger.info("Local Whisper model loaded successfully")
+        except ImportError as e:
+            logger.warning("faster-whisper not available: %s", e)
+            raise
 
-                self._whisper_processor = WhisperProcessor.from_pretrained(model_name)
-                self._whisper_local_model = WhisperForConditionalGeneration.from_pretrained(model_name)
+    def _load_whisper_transformers(self):
+        """Load Whisper through HuggingFace transformers."""
+        try:
+            import torch
+            from transformers import WhisperProcessor, WhisperForConditionalGeneration
 
-                # Use GPU if available
-                if torch.cuda.is_available():
-                    self._whisper_local_model = self._whisper_local_model.to("cuda")
-                elif torch.backends.mps.is_available():
-                    self._whisper_local_model = self._whisper_local_model.to("mps")
+            model_name = "openai/whisper-base"  # Start with base, upgrade as needed
+            logger.info("Loading local Whisper model: %s", model_name)
 
-                logging.info("Local Whisper model loaded successfully")
+            cuda = torch.cuda.is_available()
+            mps = torch.backends.mps.is_available()
+
+            # Half precision halves the weight bytes read per decoder step
+            dtype = torch.float16 if cuda or mps else torch.float32
+
+            self._whisper_processor = WhisperProcessor.from_pretrained(model_name)
+            self._whisper_local_model = WhisperForConditionalGeneration.from_pretrained(
+                model_name,
+                torch_dtype=dtype,
+                low_cpu_mem_usage=True
+            )
+
+            # Use GPU if available
+            if cuda:
+                self._whisper_local_model = self._whisper_local_model.to("cuda")
+                self._compile_whisper_transformers(dtype)
+            elif mps:
+                self._whisper_local_model = self._whisper_local_model.to("mps")
+            elif settings.WHISPER_INT8:
+                # INT8 weights for the Linear layers on CPU-only hosts
+                self._whisper_local_model = torch.ao.quantization.quantize_dynamic(
+                    self._whisper_local_model,
+                    {torch.nn.Linear},
+                    dtype=torch.qint8
+                )
+
+            logger.info("Local Whisper model loaded successfully")
+        except ImportError as e:
+            logger.warning("Local Whisper not available: %s", e)
+            raise
+
+    def _get_whisper_trt(self):
+        """Lazy load Whisper compiled to a TensorRT engine."""
+        if self._whisper_trt_model is None:
+            try:
+                from whisper_trt import load_trt_model
+
+                logger.info("Loading whisper_trt model: base.en")
+
+                # The first load builds the engine and caches it at this path
+                self._whisper_trt_model = load_trt_model(
+                    "base.en",
+                    path="models/whisper_trt/base_en.pth"
+                )
+                logger.info("whisper_trt model loaded successfully")
             except ImportError as e:
-                logging.warning(f"Local Whisper not available: {e}")
+                logger.warning("whisper_trt not available: %s", e)
                 raise
-        return self._whisper_local_model
+        return self._whisper_trt_model
+
+    def _compile_whisper_transformers(self, dtype):
+        """Compile the CUDA model's forward and capture graphs up front."""
+        import torch
+
+        model = self._whisper_local_model
+        model.forward = torch.compile(
+            model.forward,
+            mode="reduce-overhead",
+            fullgraph=False
+        )
+
+        # One pass over 30 s of silence so compilation isn't paid by a user
+        feature_extractor = self._whisper_processor.feature_extractor
+        dummy_features = torch.zeros(
+            1,
+            feature_extractor.feature_size,
+            feature_extractor.nb_max_frames,
+            device="cuda",
+            dtype=dtype
+        )
+        with torch.no_grad():
+            model.generate(dummy_features, **WHISPER_GENERATE_KWARGS)
+        logger.info("Local Whisper model compiled")
 
     def _get_speechbrain(self):
         """Lazy load SpeechBrain model for atypical speech."""
@@ -93,15 +271,15 @@ class TherapyASR:
 
                 # Use pre-trained model, can be swapped for fine-tuned version
                 model_source = "speechbrain/asr-wav2vec2-commonvoice-en"
-                logging.info(f"Loading SpeechBrain model: {model_source}")
+                logger.info("Loading SpeechBrain model: %s", model_source)
 
                 self._speechbrain_model = sb.pretrained.EncoderASR.from_hparams(
                     source=model_source,
                     savedir="models/speechbrain_asr"
                 )
-                logging.info("SpeechBrain model loaded successfully")
+                logger.info("SpeechBrain model loaded successfully")
             except ImportError as e:
-                logging.warning(f"SpeechBrain not available: {e}")
+                logger.warning("SpeechBrain not available: %s", e)
                 raise
         return self._speechbrain_model
 
@@ -116,6 +294,10 @@ class TherapyASR:
             if speech_condition in ["dysarthria", "apraxia", "autism", "stuttering"]:
                 return ASREngine.SPEECHBRAIN
 
+            # Use the TensorRT engine on NVIDIA GPU deployments
+            if user_profile.get("gpu") == "nvidia":
+                return ASREngine.WHISPER_TRT
+
             # Use local Whisper for privacy-focused users
             if user_profile.get("privacy_mode") == "local":
                 return ASREngine.WHISPER_LOCAL
@@ -145,10 +327,12 @@ class TherapyASR:
             TranscriptionResult with text and metadata
         """
         selected_engine = engine or self._select_engine(user_profile)
-        logging.info(f"Transcribing with engine: {selected_engine.value}")
+        logger.info("Transcribing with engine: %s", selected_engine.value)
 
         # Try selected engine with fallback chain
         fallback_order = [selected_engine]
+        if selected_engine == ASREngine.WHISPER_TRT:
+            fallback_order.append(ASREngine.WHISPER_LOCAL)
         if selected_engine != ASREngine.WHISPER_API:
             fallback_order.append(ASREngine.WHISPER_API)
 
@@ -159,15 +343,49 @@ class TherapyASR:
                     return self._transcribe_whisper_api(audio_data, filename, content_type)
                 elif eng == ASREngine.WHISPER_LOCAL:
                     return self._transcribe_whisper_local(audio_data)
+                elif eng == ASREngine.WHISPER_TRT:
+                    return self._transcribe_whisper_trt(audio_data)
                 elif eng == ASREngine.SPEECHBRAIN:
                     return self._transcribe_speechbrain(audio_data)
             except Exception as e:
-                logging.warning(f"Engine {eng.value} failed: {e}")
+                logger.warning("Engine %s failed: %s", eng.value, e)
                 last_error = e
                 continue
 
         raise RuntimeError(f"All ASR engines failed. Last error: {last_error}")
 
+    async def atranscribe(
+        self,
+        audio_data: bytes,
+        filename: str = "audio.wav",
+        content_type: str = "audio/wav",
+        user_profile: Optional[dict] = None,
+        engine: Optional[ASREngine] = None
+    ) -> TranscriptionResult:
+        """Async transcribe(): runs on the bounded ASR thread pool."""
+        selected_engine = engine or self._select_engine(user_profile)
+        if (
+            selected_engine == ASREngine.WHISPER_LOCAL
+            and settings.WHISPER_LOCAL_BACKEND == "transformers"
+        ):
+            try:
+                return await self._atranscribe_whisper_batched(audio_data)
+            except Exception as e:
+                logger.warning("Engine %s failed: %s", selected_engine.value, e)
+                engine = ASREngine.WHISPER_API
+
+        return await asyncio.get_running_loop().run_in_executor(
+            _inference_pool,
+            functools.partial(
+                self.transcribe,
+                audio_data,
+                filename=filename,
+                content_type=content_type,
+                user_profile=user_profile,
+                engine=engine
+            )
+        )
+
     def _transcribe_whisper_api(
         self,
         audio_data: bytes,
@@ -175,7 +393,7 @@ class TherapyASR:
         content_type: str
     ) -> TranscriptionResult:
         """Transcribe using OpenAI Whisper API."""
-        logging.info("Transcribing with OpenAI Whisper API")
+        logger.info("Transcribing with OpenAI Whisper API")
 
         client = self._get_openai_client()
         file_data = (filename, audio_data, content_type)
@@ -204,71 +422,244 @@ class TherapyASR:
 
     def _transcribe_whisper_local(self, audio_data: bytes) -> TranscriptionResult:
         """Transcribe using local Whisper model."""
-        logging.info("Transcribing with local Whisper")
-
-        import torch
-        import librosa
-        import numpy as np
+        logger.info("Transcribing with local Whisper")
 
         model = self._get_whisper_local()
 
         # Load audio from bytes
-        audio_array, sr = librosa.load(io.BytesIO(audio_data), sr=16000)
+        audio_array = _load_audio(audio_data)
+
+        if settings.WHISPER_LOCAL_BACKEND == "transformers":
+            return self._transcribe_whisper_transformers(model, audio_array)
 
-        # Process audio
-        input_features = self._whisper_processor(
+        # Greedy decoding; VAD skips silence before it reaches the decoder
+        segments, info = model.transcribe(
             audio_array,
-            sampling_rate=16000,
-            return_tensors="pt"
-        ).input_features
+            beam_size=1,
+            vad_filter=True,
+            word_timestamps=True
+        )
+
+        # Segments are generated lazily as decoding proceeds
+        texts = []
+        word_timestamps = []
+        for segment in segments:
+            texts.append(segment.text)
+            word_timestamps.extend(
+                {"word": w.word, "start": w.start, "end": w.end}
+                for w in segment.words or ()
+            )
 
-        # Move to same device as model
-        device = next(model.parameters()).device
-        input_features = input_features.to(device)
+        return TranscriptionResult(
+            text="".join(texts).strip(),
+            engine_used=ASREngine.WHISPER_LOCAL,
+            language=info.language,
+            word_timestamps=word_timestamps
+        )
+
+    def _transcribe_whisper_transformers(self, model, audio_array) -> TranscriptionResult:
+        """Transcribe 16 kHz audio with the HuggingFace Whisper model."""
+        return self._transcribe_whisper_batch(model, [audio_array])[0]
+
+    def _transcribe_whisper_batch(self, model, audio_arrays: list) -> List[TranscriptionResult]:
+        """Transcribe several 16 kHz clips in one generate() call."""
+        import torch
+
+        if model.device.type != "cuda":
+            # Process audio; every clip is padded to the same 30 s of features
+            input_features = self._whisper_processor(
+                audio_arrays,
+                sampling_rate=16000,
+                return_tensors="pt"
+            ).input_features
+
+            # Move to same device and precision as model
+            input_features = input_features.to(model.device, dtype=model.dtype)
 
         # Generate transcription
-        with torch.no_grad():
-            predicted_ids = model.generate(input_features)
+        with self._whisper_lock, torch.no_grad():
+            if model.device.type == "cuda":
+                # Fills pooled buffers, so it runs under the lock too
+                input_features = self._whisper_log_mel(audio_arrays, model.device, model.dtype)
+            predicted_ids = model.generate(input_features, **WHISPER_GENERATE_KWARGS)
 
-        transcription = self._whisper_processor.batch_decode(
+        transcriptions = self._whisper_processor.batch_decode(
             predicted_ids,
             skip_special_tokens=True
-        )[0]
+        )
+
+        return [
+            TranscriptionResult(
+                text=transcription.strip(),
+                engine_used=ASREngine.WHISPER_LOCAL
+            )
+            for transcription in transcriptions
+        ]
+
+    def _whisper_log_mel(self, audio_arrays: list, device, dtype):
+        """
+        Whisper log-mel features computed with torch on the model's device.
+
+        Mirrors WhisperFeatureExtractor (same filter bank, padding and
+        normalization) so only raw samples are copied to the GPU. Returns
+        a pooled buffer, so callers must hold _whisper_lock.
+        """
+        import torch
+
+        feature_extractor = self._whisper_processor.feature_extractor
+        if self._mel_filters is None:
+            self._mel_filters = torch.from_numpy(
+                feature_extractor.mel_filters
+            ).to(device, torch.float32).T
+            self._mel_window = torch.hann_window(feature_extractor.n_fft, device=device)
+
+        # Pad or trim every clip to the 30 s window
+        n_samples = feature_extractor.n_samples
+        audio = self._pooled_buffer((len(audio_arrays), n_samples), torch.float32, device)
+        audio.zero_()
+        for i, audio_array in enumerate(audio_arrays):
+            clip = torch.from_numpy(audio_array[:n_samples])
+            audio[i, :clip.shape[0]] = clip.to(device, non_blocking=True)
+
+        stft = torch.stft(
+            audio,
+            feature_extractor.n_fft,
+            feature_extractor.hop_length,
+            window=self._mel_window,
+            return_complex=True
+        )
+        magnitudes = stft[..., :-1].abs() ** 2
+        log_spec = torch.clamp(self._mel_filters @ magnitudes, min=1e-10).log10()
+
+        # Clip to 8 (log10) below each clip's peak, then rescale
+        log_spec = torch.maximum(
+            log_spec, log_spec.amax(dim=(-2, -1), keepdim=True) - 8.0
+        )
+        features = self._pooled_buffer(tuple(log_spec.shape), dtype, device)
+        return features.copy_((log_spec + 4.0) / 4.0)
+
+    def _pooled_buffer(self, shape: tuple, dtype, device):
+        """Device buffer reused across requests with the same shape and dtype."""
+        import torch
+
+        key = (shape, dtype)
+        buffer = self._buffer_pool.get(key)
+        if buffer is None:
+            buffer = torch.empty(shape, dtype=dtype, device=device)
+            self._buffer_pool[key] = buffer
+        return buffer
+
+    async def _atranscribe_whisper_batched(self, audio_data: bytes) -> TranscriptionResult:
+        """Queue a clip for the next batched transformers Whisper pass."""
+        loop = asyncio.get_running_loop()
+        audio_array = await loop.run_in_executor(_inference_pool, _load_audio, audio_data)
+
+        if self._whisper_batch_worker is None or self._whisper_batch_worker.done():
+            self._whisper_batch_queue = asyncio.Queue()
+            self._whisper_batch_worker = asyncio.create_task(self._collect_whisper_batches())
+
+        future = loop.create_future()
+        await self._whisper_batch_queue.put((audio_array, future))
+        return await future
+
+    async def _collect_whisper_batches(self):
+        """Group queued clips arriving within the batch window."""
+        queue = self._whisper_batch_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + WHISPER_BATCH_WINDOW
+            while len(batch) < WHISPER_MAX_BATCH_SIZE:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(queue.get(), deadline - loop.time())
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # Take whatever else is already waiting, without extending the window
+            while len(batch) < WHISPER_MAX_BATCH_SIZE * WHISPER_SORT_BATCHES:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # Skip callers that were cancelled while waiting, then group by length
+            pending = sorted(
+                ((audio, future) for audio, future in batch if not future.done()),
+                key=lambda item: len(item[0])
+            )
+            for i in range(0, len(pending), WHISPER_MAX_BATCH_SIZE):
+                task = asyncio.create_task(
+                    self._dispatch_whisper_batch(pending[i:i + WHISPER_MAX_BATCH_SIZE])
+                )
+                self._whisper_batch_tasks.add(task)
+                task.add_done_callback(self._whisper_batch_tasks.discard)
+
+    async def _dispatch_whisper_batch(self, batch: list):
+        """Run one batch on the ASR pool and fan the results back out."""
+        loop = asyncio.get_running_loop()
+        try:
+            model = await loop.run_in_executor(_inference_pool, self._get_whisper_local)
+            results = await loop.run_in_executor(
+                _inference_pool,
+                self._transcribe_whisper_batch,
+                model,
+                [audio for audio, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _transcribe_whisper_trt(self, audio_data: bytes) -> TranscriptionResult:
+        """Transcribe using Whisper on TensorRT."""
+        logger.info("Transcribing with whisper_trt")
+
+        model = self._get_whisper_trt()
+
+        result = model.transcribe(_load_audio(audio_data))
 
         return TranscriptionResult(
-            text=transcription.strip(),
-            engine_used=ASREngine.WHISPER_LOCAL
+            text=result["text"].strip(),
+            engine_used=ASREngine.WHISPER_TRT
         )
 
     def _transcribe_speechbrain(self, audio_data: bytes) -> TranscriptionResult:
         """Transcribe using SpeechBrain (optimized for atypical speech)."""
-        logging.info("Transcribing with SpeechBrain")
+        logger.info("Transcribing with SpeechBrain")
 
-        import tempfile
-        import os
+        import torch
 
         model = self._get_speechbrain()
 
-        # SpeechBrain requires file path, write temp file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(audio_data)
-            temp_path = f.name
+        # Decode in memory, mono at the model's rate, as transcribe_file
+        # would after reading from disk
+        wav = torch.from_numpy(
+            _load_audio(audio_data, model.audio_normalizer.sample_rate)
+        )
 
-        try:
-            transcription = model.transcribe_file(temp_path)
+        predicted_words, _ = model.transcribe_batch(
+            wav.unsqueeze(0),
+            torch.tensor([1.0])
+        )
+        transcription = predicted_words[0]
 
-            # Handle different return types
-            if isinstance(transcription, list):
-                text = transcription[0] if transcription else ""
-            else:
-                text = str(transcription)
+        # Handle different return types
+        if isinstance(transcription, list):
+            text = transcription[0] if transcription else ""
+        else:
+            text = str(transcription)
 
-            return TranscriptionResult(
-                text=text.strip(),
-                engine_used=ASREngine.SPEECHBRAIN
-            )
-        finally:
-            os.unlink(temp_path)
+        return TranscriptionResult(
+            text=text.strip(),
+            engine_used=ASREngine.SPEECHBRAIN
+        )
 
 
 # Singleton instance for reuse
@@ -303,3 +694,24 @@ def transcribe_for_therapy(
         user_profile=user_profile,
         engine=engine
     )
+
+
+async def warmup_asr(engines: set[str]) -> None:
+    """Load the named local ASR engines and run one dummy transcription each."""
+    asr = get_therapy_asr()
+    transcribers = {
+        ASREngine.WHISPER_LOCAL: asr._transcribe_whisper_local,
+        ASREngine.WHISPER_TRT: asr._transcribe_whisper_trt,
+        ASREngine.SPEECHBRAIN: asr._transcribe_speechbrain,
+    }
+    audio_data = _silent_wav()
+    loop = asyncio.get_running_loop()
+
+    for engine, transcribe in transcribers.items():
+        if engine.value not in engines:
+            continue
+        try:
+            await loop.run_in_executor(_inference_pool, transcribe, audio_data)
+            logger.info("Preloaded ASR engine: %s", engine.value)
+        except Exception as e:
+            logger.warning("Could not preload ASR engine %s: %s", engine.value, e)
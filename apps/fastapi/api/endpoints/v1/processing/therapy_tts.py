@@ -8,17 +8,88 @@ Supports:
 """
 
 import io
+import asyncio
+import hashlib
 import logging
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Optional
+from typing import AsyncGenerator, AsyncIterator, Optional
 from dataclasses import dataclass
 
 from api.config import settings
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+# Blocking synthesis calls run here so they never stall the event loop
+_synthesis_pool = ThreadPoolExecutor(
+    max_workers=settings.TTS_PARALLELISM,
+    thread_name_prefix="tts"
+)
+
+# Edge TTS coroutines run on one long-lived loop in a daemon thread instead
+# of a fresh event loop per request
+_edge_loop: Optional[asyncio.AbstractEventLoop] = None
+_edge_loop_lock = threading.Lock()
+
+
+def _get_edge_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared Edge TTS event loop on first use."""
+    global _edge_loop
+    with _edge_loop_lock:
+        if _edge_loop is None:
+            _edge_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_edge_loop.run_forever,
+                name="edge-tts",
+                daemon=True
+            ).start()
+    return _edge_loop
+
+
+# Chunk size for streamed OpenAI TTS audio
+STREAM_CHUNK_SIZE = 8192
+# Chunk size when streaming already-synthesized audio to the client
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+# Speaker embeddings kept per distinct voice_reference (LRU)
+SPEAKER_EMBEDDING_CACHE_SIZE = 64
+
+# Synthesized therapy prompts kept in memory (LRU); exercises repeat the same prompts
+PROMPT_CACHE_SIZE = 256
+
+# STFT settings for the phase-vocoder time stretch
+STRETCH_N_FFT = 1024
+STRETCH_HOP_LENGTH = 256
+
+
+def _time_stretch(audio, rate: float):
+    """Pitch-preserving time stretch of a 1-D tensor, on its own device."""
+    import math
+    import torch
+    import torchaudio
+
+    window = torch.hann_window(STRETCH_N_FFT, device=audio.device)
+    spec = torch.stft(
+        audio,
+        n_fft=STRETCH_N_FFT,
+        hop_length=STRETCH_HOP_LENGTH,
+        window=window,
+        return_complex=True
+    )
+    phase_advance = torch.linspace(
+        0, math.pi * STRETCH_HOP_LENGTH, spec.size(-2), device=audio.device
+    )[..., None]
+    spec = torchaudio.functional.phase_vocoder(spec, rate, phase_advance)
+    return torch.istft(
+        spec,
+        n_fft=STRETCH_N_FFT,
+        hop_length=STRETCH_HOP_LENGTH,
+        window=window
+    )
 
 
 class TTSEngine(str, Enum):
@@ -38,6 +109,35 @@ class TTSVoice(str, Enum):
     CUSTOM = "custom"  # Voice cloning
 
 
+# Map voice presets to OpenAI voices
+OPENAI_VOICES = {
+    TTSVoice.NEUTRAL: "alloy",
+    TTSVoice.WARM: "nova",
+    TTSVoice.CLEAR: "onyx",
+    TTSVoice.SLOW: "alloy",  # Use speed parameter
+    TTSVoice.CUSTOM: "alloy",
+}
+
+# Map voice presets to Edge TTS voices
+EDGE_VOICES = {
+    TTSVoice.NEUTRAL: "en-US-JennyNeural",
+    TTSVoice.WARM: "en-US-AriaNeural",
+    TTSVoice.CLEAR: "en-US-GuyNeural",
+    TTSVoice.SLOW: "en-US-JennyNeural",
+    TTSVoice.CUSTOM: "en-US-JennyNeural",
+}
+
+
+# Spoken wrappers for therapy exercise prompts
+_PROMPT_TEMPLATES = {
+    "repeat_after_me": "Please repeat after me: {t}",
+    "pronunciation": "Let's practice saying: {t}. Listen carefully.",
+    "slower": "Now try saying it more slowly: {t}",
+    "word_by_word": "Let's break it down. {t}",
+    "encouragement": "Great try! Let's practice {t} again.",
+}
+
+
 @dataclass
 class TTSResult:
     """TTS synthesis result."""
@@ -48,6 +148,42 @@ class TTSResult:
     duration_seconds: Optional[float] = None
 
 
+@dataclass
+class TTSStream:
+    """Streaming TTS result; the first chunk has already been produced."""
+    chunks: AsyncIterator[bytes]
+    format: str  # wav, mp3
+    engine_used: TTSEngine
+
+
+async def _primed(chunks: AsyncGenerator[bytes, None]) -> AsyncIterator[bytes]:
+    """Pull the first chunk now so engine errors surface before streaming starts.
+
+    The returned stream closes chunks when it finishes or is closed early,
+    e.g. on client disconnect, so the upstream connection is released.
+    """
+    try:
+        first = await anext(chunks)
+    except StopAsyncIteration:
+        raise RuntimeError("TTS engine returned no audio") from None
+
+    async def _rest():
+        try:
+            yield first
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    return _rest()
+
+
+async def iter_audio_chunks(audio_bytes: bytes) -> AsyncIterator[bytes]:
+    """Yield synthesized audio in AUDIO_CHUNK_SIZE pieces for a StreamingResponse."""
+    for start in range(0, len(audio_bytes), AUDIO_CHUNK_SIZE):
+        yield audio_bytes[start:start + AUDIO_CHUNK_SIZE]
+
+
 class TherapyTTS:
     """
     TTS engine for therapy applications.
@@ -62,6 +198,11 @@ class TherapyTTS:
         self.default_engine = default_engine
         self._whisperspeech_pipe = None
         self._openai_client = None
+        self._async_openai_client = None
+        self._spk_emb_cache: OrderedDict[str, object] = OrderedDict()
+        self._spk_emb_lock = threading.Lock()
+        self._prompt_cache: OrderedDict[tuple, TTSResult] = OrderedDict()
+        self._prompt_lock = threading.Lock()
 
     def _get_openai_client(self):
         """Lazy load OpenAI client."""
@@ -70,21 +211,45 @@ class TherapyTTS:
             self._openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
         return self._openai_client
 
+    def _get_async_openai_client(self):
+        """Lazy load async OpenAI client (used for streaming)."""
+        if self._async_openai_client is None:
+            from openai import AsyncOpenAI
+            self._async_openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        return self._async_openai_client
+
     def _get_whisperspeech(self):
         """Lazy load WhisperSpeech pipeline."""
         if self._whisperspeech_pipe is None:
             try:
                 from whisperspeech.pipeline import Pipeline
-                logging.info("Loading WhisperSpeech pipeline...")
+                logger.info("Loading WhisperSpeech pipeline...")
                 self._whisperspeech_pipe = Pipeline(
                     s2a_ref='collabora/whisperspeech:s2a-q4-tiny-en+pl.model'
                 )
-                logging.info("WhisperSpeech loaded successfully")
+                logger.info("WhisperSpeech loaded successfully")
             except ImportError as e:
-                logging.warning(f"WhisperSpeech not available: {e}")
+                logger.warning("WhisperSpeech not available: %s", e)
                 raise
         return self._whisperspeech_pipe
 
+    def _get_speaker_embedding(self, pipe, voice_reference: bytes):
+        """Speaker embedding for reference audio, cached by content hash."""
+        key = hashlib.blake2b(voice_reference, digest_size=16).hexdigest()
+        with self._spk_emb_lock:
+            spk_emb = self._spk_emb_cache.get(key)
+            if spk_emb is not None:
+                self._spk_emb_cache.move_to_end(key)
+                return spk_emb
+
+        spk_emb = pipe.extract_spk_emb(io.BytesIO(voice_reference))
+
+        with self._spk_emb_lock:
+            self._spk_emb_cache[key] = spk_emb
+            if len(self._spk_emb_cache) > SPEAKER_EMBEDDING_CACHE_SIZE:
+                self._spk_emb_cache.popitem(last=False)
+        return spk_emb
+
     def _select_engine(self, voice_reference: Optional[bytes] = None) -> TTSEngine:
         """Select TTS engine based on requirements."""
         if self.default_engine != TTSEngine.AUTO:
@@ -121,7 +286,7 @@ class TherapyTTS:
             TTSResult with audio bytes
         """
         selected_engine = engine or self._select_engine(voice_reference)
-        logging.info(f"Synthesizing with engine: {selected_engine.value}")
+        logger.info("Synthesizing with engine: %s", selected_engine.value)
 
         # Fallback chain
         fallback_order = [selected_engine]
@@ -140,12 +305,113 @@ class TherapyTTS:
                 elif eng == TTSEngine.EDGE_TTS:
                     return self._synthesize_edge_tts(text, voice, speed, output_format)
             except Exception as e:
-                logging.warning(f"Engine {eng.value} failed: {e}")
+                logger.warning("Engine %s failed: %s", eng.value, e)
+                last_error = e
+                continue
+
+        raise RuntimeError(f"All TTS engines failed. Last error: {last_error}")
+
+    async def asynthesize(self, text: str, **kwargs) -> TTSResult:
+        """Async synthesize(): runs on the bounded TTS thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _synthesis_pool,
+            functools.partial(self.synthesize, text, **kwargs)
+        )
+
+    async def asynthesize_stream(
+        self,
+        text: str,
+        voice: TTSVoice = TTSVoice.NEUTRAL,
+        speed: float = 1.0,
+        voice_reference: Optional[bytes] = None,
+        engine: Optional[TTSEngine] = None,
+        output_format: str = "wav"
+    ) -> TTSStream:
+        """
+        Synthesize speech as a stream of audio chunks.
+
+        OpenAI and Edge TTS stream as audio is produced; WhisperSpeech
+        renders the full clip, which is then sent in chunks. The fallback
+        chain is the same as synthesize() and applies until the first
+        chunk has arrived.
+        """
+        selected_engine = engine or self._select_engine(voice_reference)
+        logger.info("Streaming synthesis with engine: %s", selected_engine.value)
+
+        fallback_order = [selected_engine]
+        if selected_engine != TTSEngine.OPENAI_TTS:
+            fallback_order.append(TTSEngine.OPENAI_TTS)
+
+        last_error = None
+        for eng in fallback_order:
+            try:
+                if eng == TTSEngine.OPENAI_TTS:
+                    fmt = "wav" if output_format == "wav" else "mp3"
+                    chunks = self._stream_openai(text, voice, speed, fmt)
+                elif eng == TTSEngine.EDGE_TTS:
+                    fmt = "mp3"
+                    chunks = self._stream_edge_tts(text, voice, speed)
+                else:
+                    result = await self.asynthesize(
+                        text,
+                        voice=voice,
+                        speed=speed,
+                        voice_reference=voice_reference,
+                        engine=eng,
+                        output_format=output_format
+                    )
+                    fmt = result.format
+                    chunks = iter_audio_chunks(result.audio_bytes)
+
+                return TTSStream(
+                    chunks=await _primed(chunks),
+                    format=fmt,
+                    engine_used=eng
+                )
+            except Exception as e:
+                logger.warning("Engine %s failed: %s", eng.value, e)
                 last_error = e
                 continue
 
         raise RuntimeError(f"All TTS engines failed. Last error: {last_error}")
 
+    async def _stream_openai(
+        self,
+        text: str,
+        voice: TTSVoice,
+        speed: float,
+        response_format: str
+    ) -> AsyncIterator[bytes]:
+        """Stream audio from the OpenAI TTS API as it is generated."""
+        client = self._get_async_openai_client()
+        async with client.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice=OPENAI_VOICES.get(voice, "alloy"),
+            input=text,
+            speed=speed,
+            response_format=response_format
+        ) as response:
+            async for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                yield chunk
+
+    async def _stream_edge_tts(
+        self,
+        text: str,
+        voice: TTSVoice,
+        speed: float
+    ) -> AsyncIterator[bytes]:
+        """Stream Edge TTS audio chunks straight from the service."""
+        import edge_tts
+
+        communicate = edge_tts.Communicate(
+            text,
+            EDGE_VOICES.get(voice, "en-US-JennyNeural"),
+            rate=f"{int((speed - 1) * 100):+d}%"
+        )
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
     def _synthesize_openai(
         self,
         text: str,
@@ -154,22 +420,13 @@ class TherapyTTS:
         output_format: str
     ) -> TTSResult:
         """Synthesize using OpenAI TTS API."""
-        logging.info("Synthesizing with OpenAI TTS")
+        logger.info("Synthesizing with OpenAI TTS")
 
         client = self._get_openai_client()
 
-        # Map voice presets to OpenAI voices
-        voice_map = {
-            TTSVoice.NEUTRAL: "alloy",
-            TTSVoice.WARM: "nova",
-            TTSVoice.CLEAR: "onyx",
-            TTSVoice.SLOW: "alloy",  # Use speed parameter
-            TTSVoice.CUSTOM: "alloy",
-        }
-
         response = client.audio.speech.create(
             model="tts-1",
-            voice=voice_map.get(voice, "alloy"),
+            voice=OPENAI_VOICES.get(voice, "alloy"),
             input=text,
             speed=speed,
             response_format="wav" if output_format == "wav" else "mp3"
@@ -192,7 +449,7 @@ class TherapyTTS:
         output_format: str
     ) -> TTSResult:
         """Synthesize using WhisperSpeech with optional voice cloning."""
-        logging.info("Synthesizing with WhisperSpeech")
+        logger.info("Synthesizing with WhisperSpeech")
 
         import torch
         import numpy as np
@@ -202,47 +459,41 @@ class TherapyTTS:
         # Generate audio
         if voice_reference:
             # Voice cloning mode
-            import tempfile
-            import os
-
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                f.write(voice_reference)
-                ref_path = f.name
-
-            try:
-                audio = pipe.generate(text, speaker=ref_path)
-            finally:
-                os.unlink(ref_path)
+            spk_emb = self._get_speaker_embedding(pipe, voice_reference)
+            audio = pipe.generate(text, speaker=spk_emb)
         else:
             audio = pipe.generate(text)
 
-        # Convert to bytes
-        if isinstance(audio, torch.Tensor):
-            audio_np = audio.cpu().numpy()
-        else:
-            audio_np = np.array(audio)
+        # Keep the audio on the pipeline's device until it has been stretched
+        if not isinstance(audio, torch.Tensor):
+            audio = torch.as_tensor(np.array(audio))
 
         # Ensure correct shape
-        if audio_np.ndim > 1:
-            audio_np = audio_np.squeeze()
+        audio = audio.squeeze().float()
 
-        # Apply speed adjustment if needed
+        # Apply speed adjustment if needed; rebinding drops the pre-stretch tensor
         if speed != 1.0:
-            import librosa
-            audio_np = librosa.effects.time_stretch(audio_np, rate=speed)
+            audio = _time_stretch(audio, speed)
+
+        audio_np = audio.cpu().numpy()
+        del audio
 
-        # Convert to wav bytes
+        # Convert to 16-bit wav bytes
         import soundfile as sf
         buffer = io.BytesIO()
-        sf.write(buffer, audio_np, 24000, format='WAV')
-        buffer.seek(0)
+        sf.write(buffer, audio_np, 24000, format='WAV', subtype='PCM_16')
+        num_samples = len(audio_np)
+        del audio_np
+
+        if settings.TTS_LOW_VRAM and torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
         return TTSResult(
-            audio_bytes=buffer.read(),
+            audio_bytes=buffer.getvalue(),
             format="wav",
             sample_rate=24000,
             engine_used=TTSEngine.WHISPERSPEECH,
-            duration_seconds=len(audio_np) / 24000
+            duration_seconds=num_samples / 24000
         )
 
     def _synthesize_edge_tts(
@@ -253,24 +504,14 @@ class TherapyTTS:
         output_format: str
     ) -> TTSResult:
         """Synthesize using Edge TTS (lightweight fallback)."""
-        logging.info("Synthesizing with Edge TTS")
+        logger.info("Synthesizing with Edge TTS")
 
-        import asyncio
         import edge_tts
 
-        # Map voice presets to Edge TTS voices
-        voice_map = {
-            TTSVoice.NEUTRAL: "en-US-JennyNeural",
-            TTSVoice.WARM: "en-US-AriaNeural",
-            TTSVoice.CLEAR: "en-US-GuyNeural",
-            TTSVoice.SLOW: "en-US-JennyNeural",
-            TTSVoice.CUSTOM: "en-US-JennyNeural",
-        }
-
         async def _generate():
             communicate = edge_tts.Communicate(
                 text,
-                voice_map.get(voice, "en-US-JennyNeural"),
+                EDGE_VOICES.get(voice, "en-US-JennyNeural"),
                 rate=f"{int((speed - 1) * 100):+d}%"
             )
             buffer = io.BytesIO()
@@ -279,7 +520,9 @@ class TherapyTTS:
                     buffer.write(chunk["data"])
             return buffer.getvalue()
 
-        audio_bytes = asyncio.run(_generate())
+        audio_bytes = asyncio.run_coroutine_threadsafe(
+            _generate(), _get_edge_loop()
+        ).result()
 
         return TTSResult(
             audio_bytes=audio_bytes,
@@ -305,26 +548,49 @@ class TherapyTTS:
         Returns:
             TTSResult with exercise audio
         """
-        prompts = {
-            "repeat_after_me": f"Please repeat after me: {target_text}",
-            "pronunciation": f"Let's practice saying: {target_text}. Listen carefully.",
-            "slower": f"Now try saying it more slowly: {target_text}",
-            "word_by_word": f"Let's break it down. {target_text}",
-            "encouragement": f"Great try! Let's practice {target_text} again.",
-        }
-
-        prompt_text = prompts.get(exercise_type, target_text)
+        template = _PROMPT_TEMPLATES.get(exercise_type)
+        prompt_text = template.format(t=target_text) if template else target_text
 
         # Use slower speed for therapy prompts
         speed = kwargs.pop("speed", 0.9)
 
-        return self.synthesize(
+        # Only plain prompts are cached; voice cloning or engine overrides bypass it
+        cache_key = (prompt_text, speed) if not kwargs else None
+        if cache_key is not None:
+            with self._prompt_lock:
+                cached = self._prompt_cache.get(cache_key)
+                if cached is not None:
+                    self._prompt_cache.move_to_end(cache_key)
+                    return cached
+
+        result = self.synthesize(
             text=prompt_text,
             speed=speed,
             voice=TTSVoice.CLEAR,
             **kwargs
         )
 
+        if cache_key is not None:
+            with self._prompt_lock:
+                self._prompt_cache[cache_key] = result
+                if len(self._prompt_cache) > PROMPT_CACHE_SIZE:
+                    self._prompt_cache.popitem(last=False)
+        return result
+
+    async def agenerate_therapy_prompt(
+        self,
+        exercise_type: str,
+        target_text: str,
+        **kwargs
+    ) -> TTSResult:
+        """Async generate_therapy_prompt(): runs on the bounded TTS thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _synthesis_pool,
+            functools.partial(
+                self.generate_therapy_prompt, exercise_type, target_text, **kwargs
+            )
+        )
+
 
 # Singleton instance
 _therapy_tts_instance: Optional[TherapyTTS] = None
@@ -352,3 +618,19 @@ def synthesize_speech(
         speed=speed,
         voice_reference=voice_reference
     )
+
+
+async def warmup_tts(engines: set[str]) -> None:
+    """Load WhisperSpeech if named and run one dummy synthesis."""
+    if TTSEngine.WHISPERSPEECH.value not in engines:
+        return
+
+    tts = get_therapy_tts()
+    try:
+        await asyncio.get_running_loop().run_in_executor(
+            _synthesis_pool,
+            functools.partial(tts._synthesize_whisperspeech, "Hello.", None, 1.0, "wav")
+        )
+        logger.info("Preloaded TTS engine: whisperspeech")
+    except Exception as e:
+        logger.warning("Could not preload TTS engine whisperspeech: %s", e)
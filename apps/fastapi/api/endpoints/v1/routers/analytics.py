@@ -6,23 +6,36 @@ Endpoints:
 - GET /analytics/detailed - Detailed metrics for therapist view
 - GET /analytics/trends - Progress trends over time
 - GET /analytics/recommendations - AI-powered recommendations
+- GET /analytics/dashboard - All dashboard views in one response
 """
 
+import asyncio
+import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
-from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel, Field
+from datetime import date, datetime
+from typing import Any, Callable, Optional
 
-from api.config import settings
+import numpy as np
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from api.cache import get_or_set, get_redis
 from api.endpoints.v1.auth.verify import verify_token
 
 router = APIRouter()
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
+
+# Serialized analytics responses are reused for this many seconds
+ANALYTICS_CACHE_TTL = 300
+
+# Lets the client reuse a response for a minute before revalidating with its ETag
+ANALYTICS_CACHE_CONTROL = "private, max-age=60"
+
+# Metrics accepted by /trends; anything else falls back to "overall"
+_VALID_METRICS = frozenset({"overall", "clarity", "pace", "pcc", "pwc", "fluency"})
+
+# Serializes a response model, or a list of them, straight to JSON bytes
+_json_adapter = TypeAdapter(Any)
 
 
 # ============================================================================
@@ -31,6 +44,8 @@ else:
 
 class ProgressSummary(BaseModel):
     """Summary of user's therapy progress."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     total_sessions: int
     total_exercises: int
     total_practice_minutes: int
@@ -43,6 +58,8 @@ class ProgressSummary(BaseModel):
 
 class MetricTrend(BaseModel):
     """Single metric trend data point."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     date: str
     value: float
     metric_type: str
@@ -50,6 +67,8 @@ class MetricTrend(BaseModel):
 
 class DetailedProgress(BaseModel):
     """Detailed progress for therapist view."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     user_id: str
     period_days: int
 
@@ -81,6 +100,8 @@ class DetailedProgress(BaseModel):
 
 class ExerciseStats(BaseModel):
     """Statistics for a specific exercise type."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     exercise_type: str
     attempts: int
     average_score: float
@@ -91,6 +112,8 @@ class ExerciseStats(BaseModel):
 
 class Recommendation(BaseModel):
     """AI-generated recommendation."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     category: str  # exercise, frequency, focus_area
     title: str
     description: str
@@ -98,6 +121,25 @@ class Recommendation(BaseModel):
     action_type: Optional[str]  # specific exercise to try
 
 
+class LeaderboardEntry(BaseModel):
+    """Anonymized leaderboard row."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    rank: int
+    score: float
+    exercises: int
+
+
+class Leaderboard(BaseModel):
+    """User's standing and the anonymized top 10 for a period."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    user_rank: Optional[int]  # None when the user has no score this period
+    total_users: int
+    percentile: Optional[int]  # None when the user has no score this period
+    top_10: list[LeaderboardEntry]
+
+
 # ============================================================================
 # Mock Data Functions (Replace with DB queries)
 # ============================================================================
@@ -120,20 +162,32 @@ def _get_mock_summary(user_id: str, days: int) -> ProgressSummary:
     )
 
 
+def _get_mock_metric_rows(user_id: str, days: int) -> list[tuple[str, float, float]]:
+    """
+    Generate mock (metric, current, baseline) rows. Replace with DB queries.
+
+    All metrics come back from one query (grouped by metric) rather than
+    one query per metric.
+    """
+    return [
+        ("pcc", 78.5, 65.0),
+        ("pwc", 82.0, 70.0),
+        ("clarity", 75.0, 62.0),
+    ]
+
+
 def _get_mock_detailed(user_id: str, days: int) -> DetailedProgress:
     """Generate mock detailed data. Replace with DB queries."""
+    metrics = {}
+    for metric, current, baseline in _get_mock_metric_rows(user_id, days):
+        metrics[f"{metric}_current"] = current
+        metrics[f"{metric}_baseline"] = baseline
+        metrics[f"{metric}_improvement"] = round(current - baseline, 1)
+
     return DetailedProgress(
         user_id=user_id,
         period_days=days,
-        pcc_current=78.5,
-        pcc_baseline=65.0,
-        pcc_improvement=13.5,
-        pwc_current=82.0,
-        pwc_baseline=70.0,
-        pwc_improvement=12.0,
-        clarity_current=75.0,
-        clarity_baseline=62.0,
-        clarity_improvement=13.0,
+        **metrics,
         sessions_completed=23,
         exercises_completed=156,
         total_practice_minutes=287,
@@ -147,27 +201,28 @@ def _get_mock_detailed(user_id: str, days: int) -> DetailedProgress:
     )
 
 
+def _days_ago(offsets: np.ndarray) -> list[str]:
+    """Format today minus each offset (in days) as YYYY-MM-DD."""
+    return np.datetime_as_string(np.datetime64(date.today()) - offsets).tolist()
+
+
 def _get_mock_trends(user_id: str, days: int, metric: str) -> list[MetricTrend]:
     """Generate mock trend data. Replace with DB queries."""
-    trends = []
-    base_date = datetime.now()
-    base_value = 65.0
-
-    for i in range(min(days, 30)):
-        date = base_date - timedelta(days=days - i - 1)
-        # Simulate gradual improvement
-        value = base_value + (i * 0.5) + (i % 3 - 1)
-        trends.append(MetricTrend(
-            date=date.strftime("%Y-%m-%d"),
-            value=round(min(100, max(0, value)), 1),
-            metric_type=metric
-        ))
+    i = np.arange(min(days, 30))
+    dates = _days_ago(days - i - 1)
+    # Simulate gradual improvement
+    values = np.clip(65.0 + i * 0.5 + (i % 3 - 1), 0, 100).round(1).tolist()
 
-    return trends
+    # Values are built here, so skip per-item validation
+    return [
+        MetricTrend.model_construct(date=d, value=v, metric_type=metric)
+        for d, v in zip(dates, values)
+    ]
 
 
 def _get_mock_exercise_stats(user_id: str) -> list[ExerciseStats]:
     """Generate mock exercise stats. Replace with DB queries."""
+    today, yesterday, two_days_ago = _days_ago(np.arange(3))
     return [
         ExerciseStats(
             exercise_type="repeat_after_me",
@@ -175,7 +230,7 @@ def _get_mock_exercise_stats(user_id: str) -> list[ExerciseStats]:
             average_score=74.5,
             best_score=92.0,
             improvement=12.3,
-            last_attempted=datetime.now().strftime("%Y-%m-%d")
+            last_attempted=today
         ),
         ExerciseStats(
             exercise_type="minimal_pairs",
@@ -183,7 +238,7 @@ def _get_mock_exercise_stats(user_id: str) -> list[ExerciseStats]:
             average_score=68.0,
             best_score=85.0,
             improvement=8.5,
-            last_attempted=(datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+            last_attempted=yesterday
         ),
         ExerciseStats(
             exercise_type="tongue_twisters",
@@ -191,7 +246,7 @@ def _get_mock_exercise_stats(user_id: str) -> list[ExerciseStats]:
             average_score=62.5,
             best_score=78.0,
             improvement=5.2,
-            last_attempted=(datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+            last_attempted=two_days_ago
         ),
     ]
 
@@ -223,12 +278,113 @@ def _generate_recommendations(user_id: str) -> list[Recommendation]:
     ]
 
 
+def _get_mock_streak(user_id: str) -> dict:
+    """Generate mock streak data. Replace with DB queries."""
+    return {
+        "current_streak": 5,
+        "best_streak": 12,
+        "streak_history": [
+            {"start": "2024-11-20", "end": "2024-12-01", "days": 12},
+            {"start": "2024-12-03", "end": "2024-12-05", "days": 3},
+            {"start": "2024-12-01", "end": None, "days": 5},  # Current
+        ],
+        "next_milestone": 7,
+        "days_to_milestone": 2
+    }
+
+
+def _get_mock_leaderboard(period: str) -> Leaderboard:
+    """Generate mock leaderboard data. Used when Redis is not configured."""
+    return Leaderboard(
+        user_rank=15,
+        total_users=127,
+        percentile=88,
+        top_10=[
+            LeaderboardEntry(rank=1, score=95.2, exercises=234),
+            LeaderboardEntry(rank=2, score=93.8, exercises=198),
+            LeaderboardEntry(rank=3, score=91.5, exercises=212),
+        ]
+    )
+
+
+# Top 10 (score, exercises) pairs from the leaderboard sorted set and its
+# exercise-count hash, without returning member ids (KEYS: zset, hash)
+_TOP_10_LUA = """
+local top = redis.call('ZREVRANGE', KEYS[1], 0, 9, 'WITHSCORES')
+local rows = {}
+for i = 1, #top, 2 do
+    rows[#rows + 1] = {top[i + 1], redis.call('HGET', KEYS[2], top[i]) or '0'}
+end
+return rows
+"""
+
+
+async def _get_leaderboard(redis, user_id: str, period: str) -> Leaderboard:
+    """
+    Leaderboard from the "leaderboard:<period>" sorted set (member=user, score)
+    and the "leaderboard:<period>:exercises" hash (member=user, exercise count).
+
+    Rank, size and top 10 come back from one pipelined round trip instead
+    of a per-user rank lookup.
+    """
+    key = f"leaderboard:{period}"
+    pipe = redis.pipeline(transaction=False)
+    pipe.zrevrank(key, user_id)
+    pipe.zcard(key)
+    pipe.eval(_TOP_10_LUA, 2, key, f"{key}:exercises")
+    rank, total, top = await pipe.execute()
+
+    return Leaderboard(
+        user_rank=rank + 1 if rank is not None else None,
+        total_users=total,
+        percentile=round(100 * (1 - rank / total)) if rank is not None else None,
+        # Anonymized: members (user ids) are not exposed
+        top_10=[
+            LeaderboardEntry(rank=i + 1, score=round(float(score), 1), exercises=int(exercises))
+            for i, (score, exercises) in enumerate(top)
+        ]
+    )
+
+
+# ============================================================================
+# Response Caching
+# ============================================================================
+
+async def _cached_body(key: tuple, build: Callable[[], Any]) -> bytes:
+    """Serialized JSON for build(), computed at most once per TTL for each key."""
+    return await get_or_set(
+        "analytics:" + ":".join(map(str, key)),
+        lambda: _json_adapter.dump_json(build()),
+        ANALYTICS_CACHE_TTL
+    )
+
+
+def _etag_response(request: Request, body: bytes) -> Response:
+    """JSON response with an ETag; 304 Not Modified if the client has it."""
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if_none_match = request.headers.get("if-none-match", "")
+    headers = {"ETag": etag, "Cache-Control": ANALYTICS_CACHE_CONTROL}
+    if if_none_match == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+async def _cached_json_response(
+    request: Request,
+    key: tuple,
+    build: Callable[[], Any]
+) -> Response:
+    """Cached JSON response for build() with ETag support."""
+    return _etag_response(request, await _cached_body(key, build))
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
 
 @router.get("/summary", response_model=ProgressSummary, tags=["analytics"])
 async def get_progress_summary(
+    request: Request,
     days: int = Query(default=30, ge=1, le=365, description="Period in days"),
     user: str = Depends(verify_token),
 ):
@@ -237,14 +393,17 @@ async def get_progress_summary(
 
     Returns high-level stats suitable for the user dashboard.
     """
-    logging.info(f"Progress summary request for user: {user}, days: {days}")
+    logging.info("Progress summary request for user: %s, days: %s", user, days)
 
     # TODO: Replace with actual DB query
-    return _get_mock_summary(user, days)
+    return await _cached_json_response(
+        request, ("summary", user, days), lambda: _get_mock_summary(user, days)
+    )
 
 
 @router.get("/detailed", response_model=DetailedProgress, tags=["analytics"])
 async def get_detailed_progress(
+    request: Request,
     days: int = Query(default=30, ge=1, le=365),
     user: str = Depends(verify_token),
 ):
@@ -254,14 +413,17 @@ async def get_detailed_progress(
     Returns comprehensive metrics suitable for therapist review.
     Includes PCC, PWC, clarity scores, and improvement tracking.
     """
-    logging.info(f"Detailed progress request for user: {user}")
+    logging.info("Detailed progress request for user: %s", user)
 
     # TODO: Replace with actual DB query
-    return _get_mock_detailed(user, days)
+    return await _cached_json_response(
+        request, ("detailed", user, days), lambda: _get_mock_detailed(user, days)
+    )
 
 
 @router.get("/trends", response_model=list[MetricTrend], tags=["analytics"])
 async def get_progress_trends(
+    request: Request,
     metric: str = Query(
         default="overall",
         description="Metric type: overall, clarity, pace, pcc, pwc"
@@ -274,18 +436,22 @@ async def get_progress_trends(
 
     Returns time-series data for charting progress.
     """
-    logging.info(f"Trends request for user: {user}, metric: {metric}")
+    logging.info("Trends request for user: %s, metric: %s", user, metric)
 
-    valid_metrics = ["overall", "clarity", "pace", "pcc", "pwc", "fluency"]
-    if metric not in valid_metrics:
+    if metric not in _VALID_METRICS:
         metric = "overall"
 
     # TODO: Replace with actual DB query
-    return _get_mock_trends(user, days, metric)
+    return await _cached_json_response(
+        request,
+        ("trends", user, days, metric),
+        lambda: _get_mock_trends(user, days, metric)
+    )
 
 
 @router.get("/exercises", response_model=list[ExerciseStats], tags=["analytics"])
 async def get_exercise_stats(
+    request: Request,
     user: str = Depends(verify_token),
 ):
     """
@@ -293,14 +459,17 @@ async def get_exercise_stats(
 
     Shows which exercises the user has tried and their performance.
     """
-    logging.info(f"Exercise stats request for user: {user}")
+    logging.info("Exercise stats request for user: %s", user)
 
     # TODO: Replace with actual DB query
-    return _get_mock_exercise_stats(user)
+    return await _cached_json_response(
+        request, ("exercises", user), lambda: _get_mock_exercise_stats(user)
+    )
 
 
 @router.get("/recommendations", response_model=list[Recommendation], tags=["analytics"])
 async def get_recommendations(
+    request: Request,
     user: str = Depends(verify_token),
 ):
     """
@@ -308,14 +477,17 @@ async def get_recommendations(
 
     Analyzes user's progress and suggests focus areas, exercises, and practice tips.
     """
-    logging.info(f"Recommendations request for user: {user}")
+    logging.info("Recommendations request for user: %s", user)
 
     # TODO: Replace with ML model
-    return _generate_recommendations(user)
+    return await _cached_json_response(
+        request, ("recommendations", user), lambda: _generate_recommendations(user)
+    )
 
 
 @router.get("/streak", tags=["analytics"])
 async def get_streak_info(
+    request: Request,
     user: str = Depends(verify_token),
 ):
     """
@@ -323,24 +495,17 @@ async def get_streak_info(
 
     Returns current streak, best streak, and streak history.
     """
-    logging.info(f"Streak info request for user: {user}")
+    logging.info("Streak info request for user: %s", user)
 
     # TODO: Replace with actual DB query
-    return {
-        "current_streak": 5,
-        "best_streak": 12,
-        "streak_history": [
-            {"start": "2024-11-20", "end": "2024-12-01", "days": 12},
-            {"start": "2024-12-03", "end": "2024-12-05", "days": 3},
-            {"start": "2024-12-01", "end": None, "days": 5},  # Current
-        ],
-        "next_milestone": 7,
-        "days_to_milestone": 2
-    }
+    return await _cached_json_response(
+        request, ("streak", user), lambda: _get_mock_streak(user)
+    )
 
 
-@router.get("/leaderboard", tags=["analytics"])
+@router.get("/leaderboard", response_model=Leaderboard, tags=["analytics"])
 async def get_leaderboard(
+    request: Request,
     period: str = Query(default="week", description="week, month, all"),
     user: str = Depends(verify_token),
 ):
@@ -349,16 +514,53 @@ async def get_leaderboard(
 
     Optional gamification feature showing relative standing.
     """
-    logging.info(f"Leaderboard request for period: {period}")
+    logging.info("Leaderboard request for period: %s", period)
 
-    # TODO: Replace with actual DB query
-    return {
-        "user_rank": 15,
-        "total_users": 127,
-        "percentile": 88,
-        "top_10": [
-            {"rank": 1, "score": 95.2, "exercises": 234},
-            {"rank": 2, "score": 93.8, "exercises": 198},
-            {"rank": 3, "score": 91.5, "exercises": 212},
-        ]
+    if period not in ("week", "month", "all"):
+        period = "week"
+
+    redis = get_redis()
+    if redis is None:
+        leaderboard = _get_mock_leaderboard(period)
+    else:
+        leaderboard = await _get_leaderboard(redis, user, period)
+    return _etag_response(request, _json_adapter.dump_json(leaderboard))
+
+
+@router.get("/dashboard", tags=["analytics"])
+async def get_dashboard(
+    request: Request,
+    days: int = Query(default=30, ge=7, le=365, description="Period in days"),
+    user: str = Depends(verify_token),
+):
+    """
+    Get every dashboard view in one response.
+
+    Fetches summary, detailed, trends, exercises, recommendations and streak
+    concurrently from the shared cache, so the dashboard makes one request
+    instead of six. Each section is the same cached body its own endpoint
+    serves, spliced in without re-serializing.
+    """
+    logging.info("Dashboard request for user: %s, days: %s", user, days)
+
+    sections = {
+        "summary": (("summary", user, days), lambda: _get_mock_summary(user, days)),
+        "detailed": (("detailed", user, days), lambda: _get_mock_detailed(user, days)),
+        "trends": (
+            ("trends", user, days, "overall"),
+            lambda: _get_mock_trends(user, days, "overall")
+        ),
+        "exercises": (("exercises", user), lambda: _get_mock_exercise_stats(user)),
+        "recommendations": (
+            ("recommendations", user), lambda: _generate_recommendations(user)
+        ),
+        "streak": (("streak", user), lambda: _get_mock_streak(user)),
     }
+    bodies = await asyncio.gather(
+        *(_cached_body(key, build) for key, build in sections.values())
+    )
+    body = b"{" + b",".join(
+        b'"%s":%s' % (name.encode(), section)
+        for name, section in zip(sections, bodies)
+    ) + b"}"
+    return _etag_response(request, body)
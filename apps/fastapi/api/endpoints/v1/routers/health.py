@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from api.endpoints.v1.auth.verify import verify_token
 
@@ -12,7 +12,7 @@ async def check(user: str = Depends(verify_token)):
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "message": "Service is running smoothly",
@@ -8,23 +8,25 @@ Endpoints:
 - POST /therapy/exercise - Generate and evaluate exercises
 """
 
-import io
+import json
 import logging
 from typing import Optional
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, Query
-from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Request, UploadFile, Query
+from fastapi.responses import StreamingResponse
+from pydantic import AliasChoices, BaseModel, Field, field_validator
 
-from api.config import settings
 from api.endpoints.v1.auth.verify import verify_token
+from api.endpoints.v1.utils import detect_audio_fmt, read_bounded
 from api.endpoints.v1.processing.therapy_asr import (
-    transcribe_for_therapy,
+    get_therapy_asr,
     ASREngine,
+    TherapyASR,
     TranscriptionResult
 )
 from api.endpoints.v1.processing.therapy_tts import (
-    synthesize_speech,
     get_therapy_tts,
+    iter_audio_chunks,
+    TherapyTTS,
     TTSVoice,
     TTSEngine
 )
@@ -33,23 +35,34 @@ from api.endpoints.v1.processing.pronunciation_analysis import (
     PronunciationFeedback,
     AIFeedback
 )
-from api.endpoints.v1.processing.ai_feedback import get_ai_feedback_generator
+from api.endpoints.v1.processing.ai_feedback import AIFeedbackGenerator, get_ai_feedback_generator
 
 router = APIRouter()
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
-
-# Allowed audio types
-ALLOWED_AUDIO_TYPES = [
-    "audio/mpeg", "audio/mp4", "audio/m4a", "audio/x-m4a",
-    "audio/wav", "audio/x-wav", "audio/webm"
-]
 FILE_SIZE_LIMIT = 25 * 1024 * 1024  # 25 MB
 
 
+async def _read_audio(file: UploadFile) -> bytes:
+    """Read an audio upload, checking its format from the bytes, not the header."""
+    contents = await read_bounded(file, FILE_SIZE_LIMIT)
+    if detect_audio_fmt(contents[:12]) is None:
+        raise HTTPException(status_code=400, detail="Invalid audio file type")
+    return contents
+
+
+# Shared engines are created once in the app lifespan and kept on app.state
+def ai_feedback_generator(request: Request) -> AIFeedbackGenerator:
+    return getattr(request.app.state, "ai_feedback", None) or get_ai_feedback_generator()
+
+
+def therapy_tts(request: Request) -> TherapyTTS:
+    return getattr(request.app.state, "tts", None) or get_therapy_tts()
+
+
+def therapy_asr(request: Request) -> TherapyASR:
+    return getattr(request.app.state, "asr", None) or get_therapy_asr()
+
+
 # Request/Response Models
 class TranscribeRequest(BaseModel):
     """Request model for transcription."""
@@ -87,6 +100,27 @@ class AIFeedbackResponse(BaseModel):
     difficulty_adjustment: Optional[str] = None
 
 
+class WordErrorOut(BaseModel):
+    """Phoneme error within a word."""
+    # Read from PhonemeError.error_type; "type" lets the dumped response re-validate
+    type: str = Field(validation_alias=AliasChoices("error_type", "type"))
+    expected: str
+    actual: Optional[str]
+    suggestion: str
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def _error_type_value(cls, value):
+        return getattr(value, "value", value)
+
+
+class WordScoreOut(BaseModel):
+    """Per-word pronunciation score."""
+    word: str
+    score: float
+    errors: list[WordErrorOut]
+
+
 class PronunciationResponse(BaseModel):
     """Response model for pronunciation analysis."""
     overall_score: float
@@ -96,7 +130,7 @@ class PronunciationResponse(BaseModel):
     transcription: str
     target_text: str
     suggestions: list[str]
-    word_scores: list[dict]
+    word_scores: list[WordScoreOut]
     ai_feedback: Optional[AIFeedbackResponse] = None  # GPT-4o powered feedback
 
 
@@ -124,6 +158,7 @@ async def transcribe_therapy_audio(
     file: UploadFile = File(...),
     engine: Optional[ASREngine] = Query(None, description="ASR engine"),
     user: str = Depends(verify_token),
+    asr: TherapyASR = Depends(therapy_asr),
 ):
     """
     Transcribe audio using therapy-optimized ASR.
@@ -134,18 +169,12 @@ async def transcribe_therapy_audio(
     - speechbrain: SpeechBrain (optimized for atypical speech)
     - auto: Automatic selection based on user profile
     """
-    logging.info(f"Therapy transcription request from user: {user}")
-
-    # Validate file
-    if file.content_type not in ALLOWED_AUDIO_TYPES:
-        raise HTTPException(status_code=400, detail="Invalid audio file type")
+    logging.info("Therapy transcription request from user: %s", user)
 
-    contents = await file.read()
-    if len(contents) > FILE_SIZE_LIMIT:
-        raise HTTPException(status_code=400, detail="File size exceeds 25 MB limit")
+    contents = await _read_audio(file)
 
     try:
-        result = transcribe_for_therapy(
+        result = await asr.atranscribe(
             audio_data=contents,
             filename=file.filename or "audio.wav",
             content_type=file.content_type,
@@ -160,7 +189,7 @@ async def transcribe_therapy_audio(
         )
 
     except Exception as e:
-        logging.error(f"Transcription failed: {e}")
+        logging.error("Transcription failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
 
@@ -168,23 +197,24 @@ async def transcribe_therapy_audio(
 async def text_to_speech(
     request: TTSRequest,
     user: str = Depends(verify_token),
+    tts: TherapyTTS = Depends(therapy_tts),
 ):
     """
     Convert text to speech.
 
-    Returns audio stream (WAV format).
+    Returns audio stream (WAV format), sent as it is synthesized.
     """
-    logging.info(f"TTS request from user: {user}")
+    logging.info("TTS request from user: %s", user)
 
     try:
-        result = synthesize_speech(
+        result = await tts.asynthesize_stream(
             text=request.text,
             voice=request.voice,
             speed=request.speed
         )
 
         return StreamingResponse(
-            io.BytesIO(result.audio_bytes),
+            result.chunks,
             media_type=f"audio/{result.format}",
             headers={
                 "Content-Disposition": f"attachment; filename=speech.{result.format}",
@@ -193,7 +223,7 @@ async def text_to_speech(
         )
 
     except Exception as e:
-        logging.error(f"TTS failed: {e}")
+        logging.error("TTS failed: %s", e)
         raise HTTPException(status_code=500, detail=f"TTS failed: {str(e)}")
 
 
@@ -202,20 +232,20 @@ async def generate_therapy_prompt(
     exercise_type: str = Query(..., description="Type: repeat_after_me, pronunciation, slower"),
     target_text: str = Query(..., description="Text to practice"),
     user: str = Depends(verify_token),
+    tts: TherapyTTS = Depends(therapy_tts),
 ):
     """
     Generate audio prompt for therapy exercise.
 
     Pre-built prompts like "Please repeat after me: [text]"
     """
-    logging.info(f"Therapy prompt request: {exercise_type}")
+    logging.info("Therapy prompt request: %s", exercise_type)
 
     try:
-        tts = get_therapy_tts()
-        result = tts.generate_therapy_prompt(exercise_type, target_text)
+        result = await tts.agenerate_therapy_prompt(exercise_type, target_text)
 
         return StreamingResponse(
-            io.BytesIO(result.audio_bytes),
+            iter_audio_chunks(result.audio_bytes),
             media_type=f"audio/{result.format}",
             headers={
                 "Content-Disposition": f"attachment; filename=prompt.{result.format}"
@@ -223,7 +253,7 @@ async def generate_therapy_prompt(
         )
 
     except Exception as e:
-        logging.error(f"Prompt generation failed: {e}")
+        logging.error("Prompt generation failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Prompt generation failed: {str(e)}")
 
 
@@ -247,16 +277,19 @@ async def analyze_pronunciation_endpoint(
 
     AI feedback uses GPT-4o via GitHub Models API for free testing.
     """
-    logging.info(f"Pronunciation analysis for user: {user}")
+    logging.info("Pronunciation analysis for user: %s", user)
 
-    # Validate file
-    if file.content_type not in ALLOWED_AUDIO_TYPES:
-        raise HTTPException(status_code=400, detail="Invalid audio file type")
+    contents = await _read_audio(file)
+
+    return await _analyze(contents, target_text, include_ai_feedback)
 
-    contents = await file.read()
-    if len(contents) > FILE_SIZE_LIMIT:
-        raise HTTPException(status_code=400, detail="File size exceeds 25 MB limit")
 
+async def _analyze(
+    contents: bytes,
+    target_text: str,
+    include_ai_feedback: bool
+) -> PronunciationResponse:
+    """Shared body of /analyze and /exercise/evaluate for an already-read upload."""
     try:
         # Now async with AI feedback integration
         feedback = await analyze_pronunciation(
@@ -265,46 +298,11 @@ async def analyze_pronunciation_endpoint(
             include_ai_feedback=include_ai_feedback
         )
 
-        # Build AI feedback response if available
-        ai_feedback_response = None
-        if feedback.ai_feedback:
-            ai_feedback_response = AIFeedbackResponse(
-                feedback=feedback.ai_feedback.feedback,
-                encouragement=feedback.ai_feedback.encouragement,
-                specific_tips=feedback.ai_feedback.specific_tips,
-                recommended_exercises=feedback.ai_feedback.recommended_exercises,
-                difficulty_adjustment=feedback.ai_feedback.difficulty_adjustment
-            )
-
-        return PronunciationResponse(
-            overall_score=feedback.overall_score,
-            clarity_score=feedback.clarity_score,
-            pace_score=feedback.pace_score,
-            fluency_score=feedback.fluency_score,
-            transcription=feedback.transcription,
-            target_text=feedback.target_text,
-            suggestions=feedback.suggestions,
-            word_scores=[
-                {
-                    "word": ws.word,
-                    "score": ws.score,
-                    "errors": [
-                        {
-                            "type": e.error_type.value,
-                            "expected": e.expected,
-                            "actual": e.actual,
-                            "suggestion": e.suggestion
-                        }
-                        for e in ws.errors
-                    ]
-                }
-                for ws in feedback.word_scores
-            ],
-            ai_feedback=ai_feedback_response
-        )
+        # Word scores and AI feedback are read straight off the dataclasses
+        return PronunciationResponse.model_validate(feedback, from_attributes=True)
 
     except Exception as e:
-        logging.error(f"Pronunciation analysis failed: {e}")
+        logging.error("Pronunciation analysis failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
@@ -385,15 +383,23 @@ async def demo_list_exercises():
     }
 
 
+def _demo_error_summary(target_text: str, transcription: str) -> str:
+    """Fake a single substitution error for demo feedback requests."""
+    if target_text == transcription:
+        return ""
+    expected = target_text.split()[0] if target_text else "word"
+    actual = transcription.split()[0] if transcription else "word"
+    return f"- '{expected}' → '{actual}' (substitution)"
+
+
 @router.post("/demo/feedback", tags=["therapy-demo"])
 async def demo_ai_feedback(
     target_text: str = Query(..., description="Text to practice"),
     transcription: str = Query(..., description="What user said"),
     score: float = Query(75.0, description="Overall score 0-100"),
+    generator: AIFeedbackGenerator = Depends(ai_feedback_generator),
 ):
     """[DEMO] Get AI feedback without auth - for testing GPT-4o integration."""
-    generator = get_ai_feedback_generator()
-
     feedback = await generator.generate_feedback(
         target_text=target_text,
         transcription=transcription,
@@ -401,12 +407,7 @@ async def demo_ai_feedback(
         clarity_score=score - 5,
         pace_score=score + 5,
         fluency_score=score,
-        errors=[{
-            "word": target_text.split()[0] if target_text else "word",
-            "expected": target_text.split()[0] if target_text else "word",
-            "actual": transcription.split()[0] if transcription else "word",
-            "error_type": "substitution"
-        }] if target_text != transcription else [],
+        error_summary=_demo_error_summary(target_text, transcription),
         user_context=None
     )
 
@@ -429,11 +430,41 @@ async def demo_ai_feedback(
     }
 
 
+@router.post("/demo/feedback/stream", tags=["therapy-demo"])
+async def demo_ai_feedback_stream(
+    target_text: str = Query(..., description="Text to practice"),
+    transcription: str = Query(..., description="What user said"),
+    score: float = Query(75.0, description="Overall score 0-100"),
+    generator: AIFeedbackGenerator = Depends(ai_feedback_generator),
+):
+    """
+    [DEMO] Stream AI feedback as Server-Sent Events without auth.
+
+    Each `data:` event carries the next JSON-encoded chunk of the feedback
+    object as GPT-4o generates it; a final `done` event ends the stream.
+    """
+    async def events():
+        async for chunk in generator.stream_feedback(
+            target_text=target_text,
+            transcription=transcription,
+            overall_score=score,
+            clarity_score=score - 5,
+            pace_score=score + 5,
+            fluency_score=score,
+            error_summary=_demo_error_summary(target_text, transcription),
+            user_context=None
+        ):
+            yield f"data: {json.dumps(chunk)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/demo/session-summary", tags=["therapy-demo"])
-async def demo_session_summary():
+async def demo_session_summary(
+    generator: AIFeedbackGenerator = Depends(ai_feedback_generator),
+):
     """[DEMO] Get AI session summary without auth."""
-    generator = get_ai_feedback_generator()
-
     summary = await generator.generate_session_summary(
         session_stats={
             "duration_minutes": 12,
@@ -449,10 +480,10 @@ async def demo_session_summary():
 
 
 @router.get("/demo/weekly-insights", tags=["therapy-demo"])
-async def demo_weekly_insights():
+async def demo_weekly_insights(
+    generator: AIFeedbackGenerator = Depends(ai_feedback_generator),
+):
     """[DEMO] Get AI weekly insights without auth."""
-    generator = get_ai_feedback_generator()
-
     insights = await generator.generate_weekly_insights(
         weekly_data={
             "sessions_this_week": 5,
@@ -522,14 +553,11 @@ async def evaluate_exercise(
     Same as /analyze but tracks exercise context.
     Includes GPT-4o AI feedback for personalized improvement tips.
     """
-    # Reuse pronunciation analysis
-    return await analyze_pronunciation_endpoint(
-        background_tasks=background_tasks,
-        file=file,
-        target_text=target_text,
-        include_ai_feedback=include_ai_feedback,
-        user=user
-    )
+    logging.info("Exercise evaluation (%s) for user: %s", exercise_type, user)
+
+    contents = await _read_audio(file)
+
+    return await _analyze(contents, target_text, include_ai_feedback)
 
 
 # Session Summary Models
@@ -569,6 +597,7 @@ class WeeklyInsightsResponse(BaseModel):
 async def get_session_summary(
     request: SessionSummaryRequest,
     user: str = Depends(verify_token),
+    ai_generator: AIFeedbackGenerator = Depends(ai_feedback_generator),
 ):
     """
     Generate AI-powered session summary.
@@ -576,10 +605,9 @@ async def get_session_summary(
     Uses GPT-4o via GitHub Models to create personalized,
     encouraging session summaries.
     """
-    logging.info(f"Session summary request from user: {user}")
+    logging.info("Session summary request from user: %s", user)
 
     try:
-        ai_generator = get_ai_feedback_generator()
         summary = await ai_generator.generate_session_summary(
             session_stats={
                 "duration_minutes": request.duration_minutes,
@@ -594,7 +622,7 @@ async def get_session_summary(
         return SessionSummaryResponse(summary=summary)
 
     except Exception as e:
-        logging.error(f"Session summary generation failed: {e}")
+        logging.error("Session summary generation failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Summary generation failed: {str(e)}")
 
 
@@ -602,6 +630,7 @@ async def get_session_summary(
 async def get_weekly_insights(
     request: WeeklyInsightsRequest,
     user: str = Depends(verify_token),
+    ai_generator: AIFeedbackGenerator = Depends(ai_feedback_generator),
 ):
     """
     Generate AI-powered weekly progress insights.
@@ -612,10 +641,9 @@ async def get_weekly_insights(
     - Focus area for next week
     - Realistic goal setting
     """
-    logging.info(f"Weekly insights request from user: {user}")
+    logging.info("Weekly insights request from user: %s", user)
 
     try:
-        ai_generator = get_ai_feedback_generator()
         insights = await ai_generator.generate_weekly_insights(
             weekly_data={
                 "sessions_this_week": request.sessions_this_week,
@@ -635,5 +663,5 @@ async def get_weekly_insights(
         )
 
     except Exception as e:
-        logging.error(f"Weekly insights generation failed: {e}")
+        logging.error("Weekly insights generation failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Insights generation failed: {str(e)}")
@@ -2,22 +2,18 @@ import io
 import logging
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
-from api.config import settings
 from api.endpoints.v1.auth.verify import verify_token
+from api.endpoints.v1.utils import read_bounded
 from api.endpoints.v1.processing.audio import transcribe_with_whisper
 from api.endpoints.v1.processing.soap import generate_soap
 
 router = APIRouter()
 
-if settings.ENVIRONMENT == "development":
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.WARNING)
-
 # OpenAI Whisper supports the following file types
-ALLOWED_FILE_TYPES = [
+ALLOWED_FILE_TYPES = frozenset({
     "audio/mpeg",
     "audio/mp4",
     "audio/m4a",
@@ -27,7 +23,7 @@ ALLOWED_FILE_TYPES = [
     "audio/webm",
     "video/mp4",
     "video/mpeg",
-]
+})
 # OpenAI Whisper file uploads are currently limited to 25 MB
 FILE_SIZE_LIMIT = 25 * 1024 * 1024  # 25 MB in bytes
 
@@ -40,18 +36,16 @@ async def transcribe_audio(
 ):
     """Endpoint to upload and process audio files with OpenAI Whisper."""
 
-    logging.info(f"Transcribing audio file: {file.filename}")
-    logging.debug(f"Audio file mime type: {file.content_type}")
+    logging.info("Transcribing audio file: %s", file.filename)
+    logging.debug("Audio file mime type: %s", file.content_type)
 
     # Check file type
     if file.content_type not in ALLOWED_FILE_TYPES:
         raise HTTPException(status_code=400, detail="Invalid file type")
 
     # Check file size
-    contents = await file.read()
-    logging.debug(f"size: {len(contents)} bytes")
-    if len(contents) > FILE_SIZE_LIMIT:
-        raise HTTPException(status_code=400, detail="File size exceeds 25 MB limit")
+    contents = await read_bounded(file, FILE_SIZE_LIMIT)
+    logging.debug("size: %s bytes", len(contents))
 
     try:
         # Use BytesIO to handle the file in-memory
@@ -63,15 +57,16 @@ async def transcribe_audio(
         # Add a background task to close the buffer after processing
         background_tasks.add_task(file_like.close)
 
+        # Both calls block on the OpenAI API, so keep them off the event loop
         # Pass the file-like object to the transcription function
-        transcription = transcribe_with_whisper(
-            file.filename, file_like, file.content_type
+        transcription = await run_in_threadpool(
+            transcribe_with_whisper, file.filename, file_like, file.content_type
         )
 
         # Generate a SOAP note from the transcription
-        soap_note = generate_soap(transcription.text)
+        soap_note = await run_in_threadpool(generate_soap, transcription.text)
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "message": f"File processed successfully by user {user}",
                 "content": soap_note,
@@ -1,7 +1,56 @@
 from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import HTTPException, UploadFile
+
+# Uploads are read in chunks of this size
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Leading four bytes of the audio containers we accept
+_AUDIO_MAGIC = {
+    b"RIFF": "wav",
+    b"OggS": "ogg",
+    b"fLaC": "flac",
+    b"\x1aE\xdf\xa3": "webm",  # EBML header
+}
 
 
 # Function to parse RFC 3339 datetime and convert to epoch time
 def parse_rfc3339(time_str):
     dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
     return dt.replace(tzinfo=timezone.utc).timestamp()
+
+
+# Read an upload, rejecting it as soon as it exceeds limit bytes
+async def read_bounded(file: UploadFile, limit: int) -> bytes:
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"File size exceeds {limit // (1024 * 1024)} MB limit"
+    )
+    # Starlette records the size once the body is spooled; skip reading if known
+    if file.size is not None and file.size > limit:
+        raise too_large
+
+    chunks = []
+    size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > limit:
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+# Identify an audio container from its first bytes; None if unrecognized
+def detect_audio_fmt(head: bytes) -> Optional[str]:
+    fmt = _AUDIO_MAGIC.get(head[:4])
+    if fmt == "wav":
+        return fmt if head[8:12] == b"WAVE" else None
+    if fmt:
+        return fmt
+    if head[4:8] == b"ftyp":
+        return "m4a"
+    # ID3 tag, or a bare MPEG audio frame sync
+    if head[:3] == b"ID3" or (len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+        return "mp3"
+    return None
@@ -1,11 +1,17 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 
 from api.config import settings
+from api.middleware import BufferedGZipMiddleware
 from api.endpoints.v1.api import api_router
+from api.endpoints.v1.processing.ai_feedback import get_ai_feedback_generator
+from api.endpoints.v1.processing.therapy_asr import get_therapy_asr, warmup_asr
+from api.endpoints.v1.processing.therapy_tts import get_therapy_tts, warmup_tts
 
 info_router = APIRouter()
 
@@ -33,6 +39,20 @@ def custom_generate_unique_id(route: APIRoute):
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Create shared engines and load the models named in PRELOAD_ENGINES."""
+    _app.state.ai_feedback = get_ai_feedback_generator()
+    _app.state.asr = get_therapy_asr()
+    _app.state.tts = get_therapy_tts()
+
+    engines = {e.strip() for e in settings.PRELOAD_ENGINES.split(",") if e.strip()}
+    if engines:
+        await warmup_asr(engines)
+        await warmup_tts(engines)
+    yield
+
+
 def get_application():
     _app = FastAPI(
         title=settings.PROJECT_NAME,
@@ -41,6 +61,8 @@ def get_application():
         root_path=settings.ROOT,
         root_path_in_servers=True,
         openapi_url=settings.openapi_url,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Allow all origins for demo - in production, restrict to specific domains
@@ -54,6 +76,10 @@ def get_application():
         allow_headers=["*"],
     )
 
+    # Compress JSON bodies over 1 KB; streamed, audio and event-stream
+    # responses pass through uncompressed
+    _app.add_middleware(BufferedGZipMiddleware, minimum_size=1024)
+
     _app.include_router(api_router, prefix=settings.API_VERSION)
     _app.include_router(info_router, tags=[""])
 
@@ -0,0 +1,62 @@
+"""
+ASGI middleware shared by the app.
+"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Content types that are never compressed: audio is already encoded, and
+# event streams must reach the client as each event is written
+GZIP_EXCLUDED_CONTENT_TYPES = ("audio/", "text/event-stream")
+
+
+class BufferedGZipMiddleware:
+    """Gzip single-body responses; pass streamed and audio responses through.
+
+    Older Starlette releases gzip every response, including audio and
+    StreamingResponse bodies, and hold streamed chunks in the zlib buffer
+    until the stream closes. Here a response goes to GZipMiddleware only
+    when its whole body arrives in one message and its content type is not
+    in GZIP_EXCLUDED_CONTENT_TYPES.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+
+        async def send_selectively(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if start_message is None:
+                await send(message)
+                return
+
+            initial, start_message = start_message, None
+            content_type = Headers(raw=initial["headers"]).get("content-type", "")
+            if (
+                message["type"] == "http.response.body"
+                and not message.get("more_body", False)
+                and not content_type.startswith(GZIP_EXCLUDED_CONTENT_TYPES)
+            ):
+                async def replay(scope: Scope, receive: Receive, send: Send) -> None:
+                    await send(initial)
+                    await send(message)
+
+                gzip = GZipMiddleware(replay, minimum_size=self.minimum_size)
+                await gzip(scope, receive, send)
+                return
+
+            await send(initial)
+            await send(message)
+
+        await self.app(scope, receive, send_selectively)
@@ -0,0 +1,19 @@
+import os
+
+# Settings are read at import time; give the required ones harmless values
+os.environ.setdefault("CLERK_JWKS_URL", "https://clerk.invalid/.well-known/jwks.json")
+os.environ.setdefault("CLERK_PEM_PUBLIC_KEY", "test")
+os.environ.setdefault("ROOT_PATH", "")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.endpoints.v1.auth.verify import verify_token
+from api.main import app
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[verify_token] = lambda: "test-user"
+    yield TestClient(app)
+    app.dependency_overrides.clear()
@@ -0,0 +1,89 @@
+import asyncio
+
+from api.endpoints.v1.processing import ai_feedback
+from api.endpoints.v1.processing.ai_feedback import AIFeedbackGenerator, AIFeedbackResult
+
+FEEDBACK = AIFeedbackResult(
+    feedback="Nice work",
+    encouragement="Keep going",
+    specific_tips=("Slow down",),
+    recommended_exercises=(),
+    difficulty_adjustment="same",
+)
+ARGS = ("the cat sat", "the cat sat", 90.0, 90.0, 90.0, 90.0, "")
+
+
+def feedback_generator(monkeypatch, request_feedback):
+    monkeypatch.setattr(ai_feedback, "get_redis", lambda: None)
+    generator = AIFeedbackGenerator()
+    generator._request_feedback = request_feedback
+    return generator
+
+
+def test_identical_requests_share_one_call(monkeypatch):
+    calls = []
+
+    async def request_feedback(attempt):
+        calls.append(attempt)
+        await asyncio.sleep(0)
+        return FEEDBACK
+
+    generator = feedback_generator(monkeypatch, request_feedback)
+
+    async def run():
+        return await asyncio.gather(
+            generator.generate_feedback(*ARGS),
+            generator.generate_feedback(*ARGS),
+        )
+
+    assert asyncio.run(run()) == [FEEDBACK, FEEDBACK]
+    assert len(calls) == 1
+    assert generator._inflight == {}
+
+
+def test_cancelled_caller_does_not_cancel_other_waiters(monkeypatch):
+    release = None
+
+    async def request_feedback(attempt):
+        await release.wait()
+        return FEEDBACK
+
+    generator = feedback_generator(monkeypatch, request_feedback)
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        first = asyncio.create_task(generator.generate_feedback(*ARGS))
+        second = asyncio.create_task(generator.generate_feedback(*ARGS))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == FEEDBACK
+        assert first.cancelled()
+        assert generator._inflight == {}
+        # The finished call is cached for later callers
+        assert await generator.generate_feedback(*ARGS) == FEEDBACK
+
+    asyncio.run(run())
+
+
+def test_failed_call_reaches_every_waiter(monkeypatch):
+    async def request_feedback(attempt):
+        await asyncio.sleep(0)
+        raise RuntimeError("upstream down")
+
+    generator = feedback_generator(monkeypatch, request_feedback)
+
+    async def run():
+        return await asyncio.gather(
+            generator.generate_feedback(*ARGS),
+            generator.generate_feedback(*ARGS),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert [str(r) for r in results] == ["upstream down", "upstream down"]
+    assert generator._feedback_cache == {}
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from api.endpoints.v1.routers import analytics
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis():
+    client = fakeredis.FakeAsyncRedis()
+    scores = {f"user-{i}": 60.0 + i * 2.5 for i in range(12)}
+    scores["test-user"] = 71.2
+
+    async def seed():
+        await client.zadd("leaderboard:week", scores)
+        await client.hset(
+            "leaderboard:week:exercises",
+            mapping={member: 10 + i for i, member in enumerate(scores)}
+        )
+
+    asyncio.run(seed())
+    return client
+
+
+def test_leaderboard_from_redis(client, monkeypatch, redis):
+    monkeypatch.setattr(analytics, "get_redis", lambda: redis)
+
+    leaderboard = client.get("/v1/analytics/leaderboard").json()
+
+    assert leaderboard["total_users"] == 13
+    assert leaderboard["user_rank"] == 8
+    assert [row["rank"] for row in leaderboard["top_10"]] == list(range(1, 11))
+    assert leaderboard["top_10"][0] == {"rank": 1, "score": 87.5, "exercises": 21}
+    assert all("user" not in row for row in leaderboard["top_10"])
+
+
+def test_leaderboard_schema_matches_without_redis(client, monkeypatch, redis):
+    monkeypatch.setattr(analytics, "get_redis", lambda: None)
+    mock = client.get("/v1/analytics/leaderboard").json()
+    monkeypatch.setattr(analytics, "get_redis", lambda: redis)
+    live = client.get("/v1/analytics/leaderboard").json()
+
+    assert live.keys() == mock.keys()
+    assert {tuple(row) for row in live["top_10"]} == {tuple(row) for row in mock["top_10"]}
+
+
+def test_leaderboard_counts_missing_exercises_as_zero(client, monkeypatch, redis):
+    asyncio.run(redis.hdel("leaderboard:week:exercises", "user-11"))
+    monkeypatch.setattr(analytics, "get_redis", lambda: redis)
+
+    top = client.get("/v1/analytics/leaderboard").json()["top_10"]
+
+    assert top[0] == {"rank": 1, "score": 87.5, "exercises": 0}
+
+
+def test_leaderboard_user_without_score(client, monkeypatch, redis):
+    asyncio.run(redis.zrem("leaderboard:week", "test-user"))
+    monkeypatch.setattr(analytics, "get_redis", lambda: redis)
+
+    leaderboard = client.get("/v1/analytics/leaderboard").json()
+
+    assert leaderboard["total_users"] == 12
+    assert leaderboard["user_rank"] is None
+    assert leaderboard["percentile"] is None
+    assert len(leaderboard["top_10"]) == 10
+    analytics.Leaderboard.model_validate(leaderboard)
+
+
+def test_leaderboard_mock_matches_response_model(client, monkeypatch):
+    monkeypatch.setattr(analytics, "get_redis", lambda: None)
+
+    leaderboard = client.get("/v1/analytics/leaderboard").json()
+
+    analytics.Leaderboard.model_validate(leaderboard)
@@ -0,0 +1,53 @@
+from api.endpoints.v1.processing.therapy_tts import TTSEngine, TTSStream
+from api.endpoints.v1.routers.therapy import ai_feedback_generator, therapy_tts
+from api.main import app
+
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+class FakeTTS:
+    async def asynthesize_stream(self, text, voice=None, speed=1.0):
+        async def chunks():
+            for _ in range(4):
+                yield b"\0" * 4096
+
+        return TTSStream(chunks=chunks(), format="wav", engine_used=TTSEngine.OPENAI_TTS)
+
+
+class FakeFeedbackGenerator:
+    async def stream_feedback(self, **kwargs):
+        for i in range(50):
+            yield {"encouragement": "keep going " * 10, "index": i}
+
+
+def test_json_is_gzipped(client):
+    response = client.get("/v1/therapy/demo/exercises", headers=GZIP)
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_tts_audio_is_not_gzipped(client):
+    app.dependency_overrides[therapy_tts] = FakeTTS
+
+    response = client.post("/v1/therapy/tts", json={"text": "hello"}, headers=GZIP)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/wav"
+    assert "content-encoding" not in response.headers
+    assert response.content == b"\0" * 4096 * 4
+
+
+def test_feedback_event_stream_is_not_gzipped(client):
+    app.dependency_overrides[ai_feedback_generator] = FakeFeedbackGenerator
+
+    response = client.post(
+        "/v1/therapy/demo/feedback/stream",
+        params={"target_text": "the cat", "transcription": "the cat"},
+        headers=GZIP,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "content-encoding" not in response.headers
+    assert response.text.count("data: ") == 51
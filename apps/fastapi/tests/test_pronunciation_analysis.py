@@ -0,0 +1,157 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+from rapidfuzz.distance import Levenshtein
+from rapidfuzz.process import cdist
+
+from api.endpoints.v1.processing.pronunciation_analysis import (
+    FLUENCY_GAP_PENALTY,
+    ErrorType,
+    PronunciationAnalyzer,
+)
+
+analyzer = PronunciationAnalyzer()
+
+
+def align(target: str, transcription: str):
+    """Aligned (target word, transcribed word) pairs; None marks a gap."""
+    target_words, trans_words = target.split(), transcription.split()
+    similarity = cdist(
+        target_words,
+        trans_words,
+        scorer=Levenshtein.normalized_similarity,
+        dtype=np.float64
+    )
+    return [
+        (
+            target_words[t] if t is not None else None,
+            trans_words[w] if w is not None else None,
+        )
+        for t, w in analyzer._align_words(similarity)
+    ]
+
+
+def error_types(errors):
+    return [(e.error_type, e.word) for e in errors]
+
+
+def test_exact_match():
+    assert align("the cat sat", "the cat sat") == [
+        ("the", "the"), ("cat", "cat"), ("sat", "sat")
+    ]
+
+    word_scores, errors, gaps = analyzer._compare_texts("the cat sat", "the cat sat")
+    assert [ws.score for ws in word_scores] == [100.0, 100.0, 100.0]
+    assert errors == []
+    assert gaps == 0
+
+
+def test_pure_omission():
+    assert align("the cat sat", "the sat") == [
+        ("the", "the"), ("cat", None), ("sat", "sat")
+    ]
+
+    word_scores, errors, gaps = analyzer._compare_texts("the sat", "the cat sat")
+    assert [(ws.word, ws.score) for ws in word_scores] == [
+        ("the", 100.0), ("cat", 0.0), ("sat", 100.0)
+    ]
+    assert error_types(errors) == [(ErrorType.OMISSION, "cat")]
+    assert errors[0].position == 1
+    assert word_scores[1].errors == (errors[0],)
+    assert gaps == 1
+
+
+def test_pure_addition():
+    assert align("the cat", "the big cat") == [
+        ("the", "the"), (None, "big"), ("cat", "cat")
+    ]
+
+    word_scores, errors, gaps = analyzer._compare_texts("the big cat", "the cat")
+    assert [ws.word for ws in word_scores] == ["the", "cat"]
+    assert error_types(errors) == [(ErrorType.ADDITION, "big")]
+    assert errors[0].position == 1
+    assert gaps == 1
+
+
+def test_substitution_is_paired_not_gapped():
+    assert align("the cat sat", "the bat sat") == [
+        ("the", "the"), ("cat", "bat"), ("sat", "sat")
+    ]
+
+    word_scores, errors, gaps = analyzer._compare_texts("the bat sat", "the cat sat")
+    assert 0.0 < word_scores[1].score < 100.0
+    assert error_types(errors) == [(ErrorType.SUBSTITUTION, "cat")]
+    assert errors[0].actual == "bat"
+    assert word_scores[1].errors == tuple(errors)
+    assert gaps == 0
+
+
+def test_empty_inputs():
+    assert align("", "") == []
+    assert align("", "hello") == [(None, "hello")]
+    assert align("hello", "") == [("hello", None)]
+
+    assert analyzer._compare_texts("", "") == ([], [], 0)
+
+    word_scores, errors, gaps = analyzer._compare_texts("hello", "")
+    assert word_scores == []
+    assert error_types(errors) == [(ErrorType.ADDITION, "hello")]
+    assert gaps == 1
+
+    word_scores, errors, gaps = analyzer._compare_texts("", "hello")
+    assert [(ws.word, ws.score) for ws in word_scores] == [("hello", 0.0)]
+    assert error_types(errors) == [(ErrorType.OMISSION, "hello")]
+    assert gaps == 1
+
+
+def test_repeated_word_omitted():
+    pairs = align("the the cat", "the cat")
+
+    assert pairs.count((None, "the")) == 0
+    assert pairs.count(("the", None)) == 1
+    assert pairs[-1] == ("cat", "cat")
+
+
+def test_gaps_preferred_over_pairing_unrelated_words():
+    # Regression: with 0..1 pair scores the shifted pairing "the"/"mat",
+    # "mat"/"extra" outscored an omission plus an addition
+    pairs = align("the cat sat on the mat", "the cat sat on mat extra")
+
+    assert pairs == [
+        ("the", "the"), ("cat", "cat"), ("sat", "sat"), ("on", "on"),
+        ("the", None), ("mat", "mat"), (None, "extra")
+    ]
+    assert ("the", "mat") not in pairs
+    assert ("mat", "extra") not in pairs
+
+    word_scores, errors, gaps = analyzer._compare_texts(
+        "the cat sat on mat extra", "the cat sat on the mat"
+    )
+    assert [ws.score for ws in word_scores] == [100.0, 100.0, 100.0, 100.0, 0.0, 100.0]
+    assert error_types(errors) == [
+        (ErrorType.OMISSION, "the"), (ErrorType.ADDITION, "extra")
+    ]
+    assert [e.position for e in errors] == [4, 5]
+    assert gaps == 2
+
+
+def test_fluency_score_penalizes_alignment_gaps():
+    assert analyzer._calculate_fluency_score(90.0, 0) == 90.0
+    assert analyzer._calculate_fluency_score(90.0, 2) == 90.0 - 2 * FLUENCY_GAP_PENALTY
+    assert analyzer._calculate_fluency_score(5.0, 3) == 0.0
+
+
+def test_analyze_fluency_uses_alignment_gaps():
+    async def atranscribe(audio_bytes):
+        return SimpleNamespace(text="The cat sat on mat extra", word_timestamps=None)
+
+    pronunciation = PronunciationAnalyzer()
+    pronunciation._asr = SimpleNamespace(atranscribe=atranscribe)
+
+    feedback = asyncio.run(pronunciation.analyze(
+        b"", "the cat sat on the mat", include_ai_feedback=False
+    ))
+
+    assert feedback.overall_score == 500.0 / 6
+    assert feedback.fluency_score == feedback.overall_score - 2 * FLUENCY_GAP_PENALTY
@@ -0,0 +1,68 @@
+import asyncio
+
+from api.endpoints.v1.processing.therapy_tts import TherapyTTS, TTSEngine, _primed
+from api.endpoints.v1.routers.therapy import therapy_tts
+from api.main import app
+
+
+class Upstream:
+    """Async chunk source that records whether it was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    async def stream(self, *args, **kwargs):
+        try:
+            for chunk in self.chunks:
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def test_primed_yields_every_chunk_and_closes_upstream():
+    upstream = Upstream([b"a", b"b", b"c"])
+
+    async def consume():
+        stream = await _primed(upstream.stream())
+        return [chunk async for chunk in stream]
+
+    assert asyncio.run(consume()) == [b"a", b"b", b"c"]
+    assert upstream.closed
+
+
+def test_primed_closes_upstream_when_stream_is_abandoned():
+    upstream = Upstream([b"a", b"b", b"c"])
+
+    async def abandon_after_first_chunk():
+        stream = await _primed(upstream.stream())
+        assert await anext(stream) == b"a"
+        await stream.aclose()
+        # Closed now, not when the event loop finalizes leftover generators
+        assert upstream.closed
+
+    asyncio.run(abandon_after_first_chunk())
+
+
+def test_empty_stream_falls_back_then_fails_cleanly(client):
+    tts = TherapyTTS()
+    tts._stream_edge_tts = Upstream([]).stream
+    tts._stream_openai = Upstream([]).stream
+    app.dependency_overrides[therapy_tts] = lambda: tts
+
+    response = client.post("/v1/therapy/tts", json={"text": "hello"})
+
+    assert response.status_code == 500
+    assert "TTS engine returned no audio" in response.json()["detail"]
+
+
+def test_empty_stream_falls_back_to_next_engine():
+    tts = TherapyTTS()
+    tts._stream_edge_tts = Upstream([]).stream
+    tts._stream_openai = Upstream([b"audio"]).stream
+
+    async def synthesize():
+        result = await tts.asynthesize_stream("hello", engine=TTSEngine.EDGE_TTS)
+        return result.engine_used, [chunk async for chunk in result.chunks]
+
+    assert asyncio.run(synthesize()) == (TTSEngine.OPENAI_TTS, [b"audio"])
@@ -0,0 +1,137 @@
+import asyncio
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from api.endpoints.v1.processing.therapy_asr import ASREngine, TranscriptionResult
+from api.endpoints.v1.routers import therapy
+from api.endpoints.v1.routers.therapy import therapy_asr
+from api.endpoints.v1.utils import UPLOAD_CHUNK_SIZE, detect_audio_fmt, read_bounded
+from api.main import app
+
+WAV_HEADER = b"RIFF\x24\x08\x00\x00WAVEfmt "
+
+
+class FakeASR:
+    async def atranscribe(self, audio_data, **kwargs):
+        return TranscriptionResult(text="hello", engine_used=ASREngine.WHISPER_API)
+
+
+@pytest.mark.parametrize("head, fmt", [
+    (WAV_HEADER, "wav"),
+    (b"OggS\x00\x02\x00\x00\x00\x00\x00\x00", "ogg"),
+    (b"fLaC\x00\x00\x00\x22\x10\x00\x10\x00", "flac"),
+    (b"\x1aE\xdf\xa3\x9fB\x86\x81\x01B\xf7\x81", "webm"),
+    (b"\x00\x00\x00\x20ftypM4A ", "m4a"),
+    (b"ID3\x04\x00\x00\x00\x00\x00\x00\x00\x00", "mp3"),
+    (b"\xff\xfb\x90\x64\x00\x00\x00\x00\x00\x00\x00\x00", "mp3"),
+    (b"\xff\xf3\x48\xc4\x00\x00\x00\x00\x00\x00\x00\x00", "mp3"),
+])
+def test_detect_audio_fmt(head, fmt):
+    assert detect_audio_fmt(head) == fmt
+
+
+@pytest.mark.parametrize("head", [
+    b"",
+    b"R",
+    b"RIFF",
+    b"RIFF\x24\x08\x00\x00WAV",
+    b"RIFF\x24\x08\x00\x00AVI LIST",
+    b"fLa",
+    b"\x1aE\xdf",
+    b"\x00\x00\x00\x20fty",
+    b"ID",
+    b"\xff",
+    b"\xff\x00",
+    b"%PDF-1.7\n%\xe2\xe3\xcf\xd3",
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\r",
+    b"PK\x03\x04\x14\x00\x00\x00\x08\x00\x00\x00",
+    b"hello world!",
+])
+def test_detect_audio_fmt_rejects_unknown_or_truncated(head):
+    assert detect_audio_fmt(head) is None
+
+
+def test_transcribe_accepts_sniffed_audio_despite_content_type(client):
+    app.dependency_overrides[therapy_asr] = FakeASR
+
+    response = client.post(
+        "/v1/therapy/transcribe",
+        files={"file": ("clip.bin", WAV_HEADER + b"\x00" * 64, "application/octet-stream")},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["text"] == "hello"
+
+
+@pytest.mark.parametrize("body", [b"", b"RIFF", b"not audio at all"])
+def test_transcribe_rejects_unknown_audio(client, body):
+    app.dependency_overrides[therapy_asr] = FakeASR
+
+    response = client.post(
+        "/v1/therapy/transcribe", files={"file": ("clip.wav", body, "audio/wav")}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid audio file type"
+
+
+def read(data: bytes, limit: int, size=None):
+    file = io.BytesIO(data)
+    upload = UploadFile(file=file, size=size)
+    try:
+        return asyncio.run(read_bounded(upload, limit)), file.tell()
+    except HTTPException as e:
+        return e, file.tell()
+
+
+@pytest.mark.parametrize("size", [None, 100])
+def test_read_bounded_accepts_upload_at_limit(size):
+    contents, _ = read(b"x" * 100, limit=100, size=size)
+
+    assert contents == b"x" * 100
+
+
+def test_read_bounded_rejects_declared_size_without_reading():
+    error, position = read(b"x" * 101, limit=100, size=101)
+
+    assert isinstance(error, HTTPException)
+    assert error.status_code == 413
+    assert position == 0
+
+
+def test_read_bounded_rejects_streamed_upload_over_limit():
+    data = b"x" * (UPLOAD_CHUNK_SIZE * 10)
+
+    error, position = read(data, limit=UPLOAD_CHUNK_SIZE + 1)
+
+    assert isinstance(error, HTTPException)
+    assert error.status_code == 413
+    # Stops at the first chunk past the limit instead of reading everything
+    assert position == UPLOAD_CHUNK_SIZE * 2
+
+
+def test_read_bounded_streams_multiple_chunks_at_limit():
+    data = bytes(range(256)) * (UPLOAD_CHUNK_SIZE * 3 // 256)
+
+    contents, _ = read(data, limit=len(data))
+
+    assert contents == data
+
+
+def test_transcribe_rejects_oversized_upload(client, monkeypatch):
+    app.dependency_overrides[therapy_asr] = FakeASR
+    monkeypatch.setattr(therapy, "FILE_SIZE_LIMIT", len(WAV_HEADER) + 64)
+
+    at_limit = client.post(
+        "/v1/therapy/transcribe",
+        files={"file": ("clip.wav", WAV_HEADER + b"\x00" * 64, "audio/wav")},
+    )
+    over_limit = client.post(
+        "/v1/therapy/transcribe",
+        files={"file": ("clip.wav", WAV_HEADER + b"\x00" * 65, "audio/wav")},
+    )
+
+    assert at_limit.status_code == 200
+    assert over_limit.status_code == 413